@@ -34,6 +34,12 @@ def main() -> None:
         action="store_true",
         help="Save tool outputs as artifacts",
     )
+    watch_parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Output format (json: one compact object per invocation)",
+    )
     watch_parser.add_argument("--daemon", action="store_true", help="Run as daemon")
     watch_parser.add_argument(
         "--pid-file", default="/tmp/openclaw_edd_watch.pid", help="PID file"
@@ -107,6 +113,18 @@ def main() -> None:
         "--dry-run", action="store_true", help="Do not send messages"
     )
     run_parser.add_argument("--session", help="Session ID (dry-run)")
+    run_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Run up to N cases in parallel (default: 1, sequential)",
+    )
+    run_parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first failing case and assertion",
+    )
     run_parser.add_argument("--show-trace", action="store_true", help="Show tool trace")
     run_parser.add_argument(
         "--baseline", help="Baseline report file (JSON) for comparison"
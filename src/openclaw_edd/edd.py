@@ -14,6 +14,7 @@ from __future__ import annotations
 import csv
 import difflib
 import json
+import re
 import sys
 from collections import Counter, defaultdict
 from datetime import datetime
@@ -25,6 +26,7 @@ from .tracer import (
     extract_events,
     get_workspace,
     read_all_logs,
+    read_logs_for_session,
     sessions_from_logs,
 )
 
@@ -48,8 +50,6 @@ def analyze_failure(result: dict, workspace: Path) -> dict:
 
     for failure in failures:
         if "Missing required tool calls" in failure:
-            import re
-
             match = re.search(r"Missing required tool calls: ([^()]+)", failure)
             if match:
                 missing_tools = [t.strip() for t in match.group(1).split(",")]
@@ -103,8 +103,6 @@ def analyze_failure(result: dict, workspace: Path) -> dict:
             )
 
         elif "Tool argument mismatch" in failure:
-            import re
-
             match = re.search(
                 r"Tool argument mismatch: (\\w+)\\.(\\w+) =(\\S+)", failure
             )
@@ -609,8 +607,6 @@ def cmd_export(args: Any) -> None:
         session_id = session["session_id"]
 
         # Read session logs
-        from .tracer import read_logs_for_session
-
         entries = read_logs_for_session(log_dir, session_id)
         events = extract_events(entries, session_id)
 
@@ -818,13 +814,17 @@ def cmd_export(args: Any) -> None:
 
     else:
         # JSONL format
-        with open(output_file, "w", encoding="utf-8") as f:
-            for record in records:
-                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        _write_jsonl(Path(output_file), records)
 
         print(f"✓ Exported {len(records)}  JSONL: {output_file}")
 
 
+def _write_jsonl(path: Path, records: list[dict[str, Any]]) -> None:
+    """Write records as JSON Lines with a single write call."""
+    payload = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records)
+    path.write_text(payload, encoding="utf-8")
+
+
 # ============================================================================
 # review
 # ============================================================================
@@ -870,9 +870,7 @@ def cmd_review(args: Any) -> None:
     print(f"   Keys: [a] approve  [r] reject  [s] skip  [q] quit\n")
 
     def _save() -> None:
-        with open(output_path, "w", encoding="utf-8") as f:
-            for record in records:
-                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        _write_jsonl(output_path, records)
 
     approved_count = 0
     rejected_count = 0
@@ -1120,8 +1118,6 @@ Return JSON:
                 response_text = response.choices[0].message.content
 
             #  JSON
-            import re
-
             json_match = re.search(r"\{[^}]+\}", response_text, re.DOTALL)
             if json_match:
                 judgment = json.loads(json_match.group(0))
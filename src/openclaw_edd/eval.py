@@ -8,19 +8,24 @@ Responsibilities:
 
 from __future__ import annotations
 
+import copy
 import json
+import queue
 import subprocess
 import sys
+import threading
 import time
-from dataclasses import asdict
 from datetime import datetime, timezone
+from functools import lru_cache
+from html import escape
 from pathlib import Path
-from typing import Any, Optional, cast
+from typing import Any, Callable, Optional, cast
 
 from . import session_reader, store
+from .jsoncodec import dumps_bytes, json_loader
 from .models import EvalCase, EvalResult, Event
 from .patterns import ActionClassifier
-from .tracer import _is_turn_end
+from .tracer import _is_turn_end, parse_line
 
 # Built-in cases
 BUILTIN_CASES: list[dict[str, Any]] = [
@@ -43,6 +48,78 @@ BUILTIN_CASES: list[dict[str, Any]] = [
         "description": "Chat should not call tools",
     },
 ]
+_BUILTIN_EVAL_CASES: tuple[EvalCase, ...] = tuple(
+    EvalCase(**cast(dict[str, Any], c)) for c in BUILTIN_CASES
+)
+
+
+def _collect_assert(field_name: str) -> Callable[[dict, dict], None]:
+    """Build a handler that appends the assertion value to a list field."""
+
+    def handler(case_data: dict, assertion: dict) -> None:
+        case_data.setdefault(field_name, []).append(assertion["value"])
+
+    return handler
+
+
+def _assert_tool_order(case_data: dict, assertion: dict) -> None:
+    case_data["expect_tools_ordered"] = assertion["value"]
+    case_data["expect_tools_ordered_strict"] = assertion.get("strict", False)
+
+
+def _assert_command_order(case_data: dict, assertion: dict) -> None:
+    case_data["expect_commands_ordered"] = assertion["value"]
+
+
+def _assert_tool_args(case_data: dict, assertion: dict) -> None:
+    case_data.setdefault("expect_tool_args", {})[assertion["tool"]] = assertion["args"]
+
+
+# Golden dataset assertion type -> EvalCase field mapper (unknown types are ignored)
+_ASSERT_HANDLERS: dict[str, Callable[[dict, dict], None]] = {
+    "tool_called": _collect_assert("expect_tools"),
+    "tool_order": _assert_tool_order,
+    "not_tool_called": _collect_assert("forbidden_tools"),
+    "contains": _collect_assert("expect_output_contains"),
+    "command_contains": _collect_assert("expect_commands"),
+    "command_order": _assert_command_order,
+    "not_command_contains": _collect_assert("forbidden_commands"),
+    "tool_args": _assert_tool_args,
+}
+
+
+@lru_cache(maxsize=32)
+def _parse_yaml_cases(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML cases file.
+
+    mtime_ns and size are part of the cache key so edits to the file
+    invalidate the cached document.
+    """
+    import yaml  # type: ignore[import-untyped]
+
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+def _load_cases_document(cases_path: Path) -> Any:
+    """Parse a JSONL/JSON/YAML cases file into a document the caller owns.
+
+    JSON decodes faster than a deep copy would, so only the (pure-Python)
+    YAML parse is cached, and callers get a private copy of it.
+    """
+    path = str(cases_path)
+    if path.endswith(".jsonl"):
+        # Both decoders accept UTF-8 bytes, so skip the text-layer decode
+        loads = json_loader()
+        with open(path, "rb") as fb:
+            return [loads(line) for line in fb]
+    if path.endswith(".json"):
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    stat = cases_path.stat()
+    document = _parse_yaml_cases(path, stat.st_mtime_ns, stat.st_size)
+    # Callers build EvalCase objects from (and may mutate) the lists inside
+    return copy.deepcopy(document)
 
 
 def load_cases(
@@ -50,7 +127,7 @@ def load_cases(
 ) -> list[EvalCase]:
     """Load test cases."""
     if not cases_file:
-        return [EvalCase(**cast(dict[str, Any], c)) for c in BUILTIN_CASES]
+        return list(_BUILTIN_EVAL_CASES)
 
     cases_path = Path(cases_file)
 
@@ -59,67 +136,29 @@ def load_cases(
         try:
             cases = []
             skipped_unreviewed = 0
-            with open(cases_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    record = json.loads(line)
-                    if only_approved:
-                        if not record.get("reviewed", False):
-                            skipped_unreviewed += 1
-                            continue
-                        if not record.get("approved", False):
-                            continue
-                    # Convert golden dataset format to EvalCase
-                    for conv in record.get("conversation", []):
-                        case_data = {
-                            "id": record["id"],
-                            "message": conv["user"],
-                            "description": record.get("description", ""),
-                            "tags": record.get("tags", []),
-                        }
-                        # Extract expectations from assertions
-                        for assertion in conv.get("assert", []):
-                            if assertion["type"] == "tool_called":
-                                if "expect_tools" not in case_data:
-                                    case_data["expect_tools"] = []
-                                case_data["expect_tools"].append(assertion["value"])
-                            elif assertion["type"] == "tool_order":
-                                case_data["expect_tools_ordered"] = assertion["value"]
-                                case_data["expect_tools_ordered_strict"] = (
-                                    assertion.get("strict", False)
-                                )
-                            elif assertion["type"] == "not_tool_called":
-                                if "forbidden_tools" not in case_data:
-                                    case_data["forbidden_tools"] = []
-                                case_data["forbidden_tools"].append(assertion["value"])
-                            elif assertion["type"] == "contains":
-                                if "expect_output_contains" not in case_data:
-                                    case_data["expect_output_contains"] = []
-                                case_data["expect_output_contains"].append(
-                                    assertion["value"]
-                                )
-                            elif assertion["type"] == "command_contains":
-                                if "expect_commands" not in case_data:
-                                    case_data["expect_commands"] = []
-                                case_data["expect_commands"].append(assertion["value"])
-                            elif assertion["type"] == "command_order":
-                                case_data["expect_commands_ordered"] = assertion[
-                                    "value"
-                                ]
-                            elif assertion["type"] == "not_command_contains":
-                                if "forbidden_commands" not in case_data:
-                                    case_data["forbidden_commands"] = []
-                                case_data["forbidden_commands"].append(
-                                    assertion["value"]
-                                )
-                            elif assertion["type"] == "tool_args":
-                                if "expect_tool_args" not in case_data:
-                                    case_data["expect_tool_args"] = {}
-                                tool_name = assertion["tool"]
-                                case_data["expect_tool_args"][tool_name] = assertion[
-                                    "args"
-                                ]
-
-                        cases.append(EvalCase(**cast(dict[str, Any], case_data)))
+            handler_for = _ASSERT_HANDLERS.get
+            for record in _load_cases_document(cases_path):
+                if only_approved:
+                    if not record.get("reviewed", False):
+                        skipped_unreviewed += 1
+                        continue
+                    if not record.get("approved", False):
+                        continue
+                # Convert golden dataset format to EvalCase
+                for conv in record.get("conversation", []):
+                    case_data = {
+                        "id": record["id"],
+                        "message": conv["user"],
+                        "description": record.get("description", ""),
+                        "tags": record.get("tags", []),
+                    }
+                    # Extract expectations from assertions
+                    for assertion in conv.get("assert", []):
+                        handler = handler_for(assertion.get("type"))
+                        if handler is not None:
+                            handler(case_data, assertion)
+
+                    cases.append(EvalCase(**cast(dict[str, Any], case_data)))
             if only_approved and skipped_unreviewed:
                 print(
                     f"ℹ Skipped {skipped_unreviewed} unreviewed records "
@@ -133,8 +172,7 @@ def load_cases(
     # JSON
     if cases_path.suffix == ".json":
         try:
-            with open(cases_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _load_cases_document(cases_path)
             return [EvalCase(**cast(dict[str, Any], c)) for c in data.get("cases", [])]
         except Exception as e:
             print(f"✗ Failed to load JSON cases: {e}")
@@ -142,10 +180,7 @@ def load_cases(
 
     # YAML
     try:
-        import yaml  # type: ignore[import-untyped]
-
-        with open(cases_file, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = _load_cases_document(cases_path)
         return [EvalCase(**c) for c in data.get("cases", [])]
     except ImportError:
         print("✗ PyYAML is required: pip install pyyaml")
@@ -155,6 +190,22 @@ def load_cases(
         sys.exit(1)
 
 
+# Where `openclaw agent --json` reports the session ID, in lookup order
+_SESSION_ID_POINTERS: tuple[tuple[str, ...], ...] = (
+    ("result", "meta", "agentMeta", "sessionId"),  # Gateway mode
+    ("meta", "agentMeta", "sessionId"),  # Local mode
+)
+
+
+def _json_pointer(data: Any, path: tuple[str, ...]) -> Any:
+    """Follow a key path through nested dicts, returning None if it breaks."""
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
 def send_message(agent: str, message: str, use_local: bool = False) -> str | None:
     """Send a message to the agent and return session_id."""
     try:
@@ -178,20 +229,11 @@ def send_message(agent: str, message: str, use_local: bool = False) -> str | Non
 
         # Parse JSON response to extract sessionId
         try:
-            data = json.loads(result.stdout)
-            # Gateway mode: result.meta.agentMeta.sessionId
-            session_id = (
-                data.get("result", {})
-                .get("meta", {})
-                .get("agentMeta", {})
-                .get("sessionId")
-            )
-            if isinstance(session_id, str) and session_id:
-                return session_id
-            # Local mode: meta.agentMeta.sessionId
-            session_id = data.get("meta", {}).get("agentMeta", {}).get("sessionId")
-            if isinstance(session_id, str) and session_id:
-                return session_id
+            data = json_loader()(result.stdout)
+            for path in _SESSION_ID_POINTERS:
+                session_id = _json_pointer(data, path)
+                if isinstance(session_id, str) and session_id:
+                    return session_id
 
             # If missing, print debug info
             print(f"⚠ Failed to extract sessionId from response")
@@ -210,14 +252,92 @@ def send_message(agent: str, message: str, use_local: bool = False) -> str | Non
         return None
 
 
+# wait_for_completion polling: back off from POLL_MIN_S to POLL_MAX_S while the
+# log is quiet, and treat STABLE_QUIET_S without new lines as completion
+POLL_MIN_S = 0.2
+POLL_MAX_S = 2.0
+POLL_BACKOFF = 1.5
+STABLE_QUIET_S = 6.0
+
+
+def _pump_lines(stream: Any, lines: queue.Queue) -> None:
+    """Forward lines from a pipe into a queue; None marks end of stream."""
+    try:
+        for line in stream:
+            lines.put(line)
+    finally:
+        lines.put(None)
+
+
+def _follow_for_completion(session_id: str, timeout_s: float) -> Optional[bool]:
+    """Wait on a single ``openclaw logs --follow`` stream.
+
+    Returns None when the stream is unavailable or ends early (e.g. an
+    openclaw build without --follow), so the caller can fall back to polling.
+    """
+    try:
+        proc = subprocess.Popen(
+            [
+                "openclaw",
+                "logs",
+                "--json",
+                "--follow",
+                f"--session={session_id}",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+    except OSError:
+        return None
+
+    lines: queue.Queue = queue.Queue()
+    threading.Thread(target=_pump_lines, args=(proc.stdout, lines), daemon=True).start()
+    start_time = time.time()
+    last_activity = start_time
+    try:
+        while True:
+            now = time.time()
+            remaining = timeout_s - (now - start_time)
+            if remaining <= 0:
+                return False
+            try:
+                line = lines.get(timeout=min(POLL_MAX_S, remaining))
+            except queue.Empty:
+                if time.time() - last_activity >= STABLE_QUIET_S:
+                    return True
+                continue
+            if line is None:
+                return None
+            last_activity = time.time()
+            entry = parse_line(line)
+            if entry and _is_turn_end(entry):
+                return True
+    finally:
+        proc.kill()
+        proc.wait()
+
+
 def wait_for_completion(session_id: str, timeout_s: int, log_dir: str) -> bool:
     """Wait for agent completion"""
     start_time = time.time()
-    last_line_count = 0
-    stable_count = 0
+    followed = _follow_for_completion(session_id, timeout_s)
+    if followed is not None:
+        return followed
+
+    # Follow stream unavailable: poll with --since for the remaining time
+    timeout_s = max(0, timeout_s - int(time.time() - start_time))
+    start_time = time.time()
+    cursor = start_time  # logs before this were fetched by an earlier poll
+    last_activity = start_time
+    seen_lines: set[str] = set()
+    delay = POLL_MIN_S
 
     while time.time() - start_time < timeout_s:
-        elapsed = int(time.time() - start_time)
+        poll_time = time.time()
+        # +1s overlap with the previous window; repeats are dropped below
+        since = int(poll_time - cursor) + 1
 
         try:
             result = subprocess.run(
@@ -226,37 +346,37 @@ def wait_for_completion(session_id: str, timeout_s: int, log_dir: str) -> bool:
                     "logs",
                     "--json",
                     f"--session={session_id}",
-                    f"--since={elapsed}s",
+                    f"--since={since}s",
                 ],
                 capture_output=True,
                 text=True,
                 timeout=5,
             )
-
-            lines = result.stdout.strip().splitlines()
-
-            # Check completion marker
-            for line in lines:
-                from .tracer import parse_line
-
+            cursor = poll_time
+
+            # Parse each unseen line once; only a count of them is kept
+            new_count = 0
+            for line in result.stdout.splitlines():
+                if not line or line in seen_lines:
+                    continue
+                seen_lines.add(line)
+                new_count += 1
                 entry = parse_line(line)
                 if entry and _is_turn_end(entry):
                     return True
 
             # Check stability
-            if len(lines) == last_line_count:
-                stable_count += 1
-                if stable_count >= 3:
-                    return True
-            else:
-                stable_count = 0
-
-            last_line_count = len(lines)
+            if new_count:
+                last_activity = poll_time
+                delay = POLL_MIN_S
+            elif poll_time - last_activity >= STABLE_QUIET_S:
+                return True
 
         except Exception:
             pass
 
-        time.sleep(2)
+        time.sleep(delay)
+        delay = min(POLL_MAX_S, delay * POLL_BACKOFF)
 
     return False
 
@@ -337,8 +457,9 @@ def _check_retries(events: list[Event], max_retries: int | None) -> dict:
     max_seen = 1
     retry_details = []
 
-    for i in range(1, len(events)):
-        prev, curr = events[i - 1], events[i]
+    # Cheap kind/tool comparisons run first; the (possibly nested) input
+    # dicts are only compared for back-to-back calls of the same tool
+    for prev, curr in zip(events, events[1:]):
         if (
             prev.kind == "tool_end"
             and curr.kind == "tool_end"
@@ -346,13 +467,14 @@ def _check_retries(events: list[Event], max_retries: int | None) -> dict:
             and prev.input == curr.input
         ):
             consecutive += 1
-            max_seen = max(max_seen, consecutive)
+            if consecutive > max_seen:
+                max_seen = consecutive
         else:
             if consecutive > 1:
                 retry_details.append(
                     {
-                        "tool": events[i - 1].tool,
-                        "command": events[i - 1].input.get("command", ""),
+                        "tool": prev.tool,
+                        "command": prev.input.get("command", ""),
                         "count": consecutive,
                     }
                 )
@@ -428,6 +550,28 @@ def _check_actions_ordered(
     }
 
 
+@lru_cache(maxsize=256)
+def _compile_keywords(keywords: tuple[str, ...]) -> tuple[str, ...]:
+    """Return the distinct case-folded keywords, in first-seen order.
+
+    Cached so a case's keyword list is only prepared once per run, even
+    under pass@k or when many cases share the same expectations.
+    """
+    return tuple(dict.fromkeys(kw.lower() for kw in keywords))
+
+
+def _missing_keywords(text_lower: str, keywords: list[str]) -> list[str]:
+    """Return keywords absent from already-lowercased text.
+
+    Each distinct keyword is searched once, so repeated keywords (common
+    in mined golden datasets) don't rescan the text.
+    """
+    absent = {kw for kw in _compile_keywords(tuple(keywords)) if kw not in text_lower}
+    if not absent:
+        return []
+    return [kw for kw in keywords if kw.lower() in absent]
+
+
 def _check_plan_contains(events: list[Event], expect_keywords: list[str]) -> dict:
     """Check that agent's plan text contains expected keywords.
 
@@ -451,7 +595,7 @@ def _check_plan_contains(events: list[Event], expect_keywords: list[str]) -> dic
             "plan_text_preview": "",
         }
 
-    missing = [kw for kw in expect_keywords if kw.lower() not in all_plan_text]
+    missing = _missing_keywords(all_plan_text, expect_keywords)
     return {
         "passed": len(missing) == 0,
         "expected": expect_keywords,
@@ -461,16 +605,26 @@ def _check_plan_contains(events: list[Event], expect_keywords: list[str]) -> dic
 
 
 def check_assertions(
-    case: EvalCase, events: list[Event], final_output: str
+    case: EvalCase, events: list[Event], final_output: str, fail_fast: bool = False
 ) -> tuple[bool, list[str], dict[str, Any]]:
-    """Check assertions."""
+    """Check assertions.
+
+    With fail_fast, return as soon as one assertion group fails; later
+    groups (tool args, actions, plan, judge) are not evaluated.
+    """
     failures: list[str] = []
     checks: dict[str, Any] = {}
-    tool_names = [e.tool for e in events if e.kind == "tool_end"]
+    # One pass over events: call order, per-tool calls, and the set of tools used
+    tool_names: list[str] = []
+    tool_events: dict[str, list[Event]] = {}
+    for e in events:
+        if e.kind == "tool_end":
+            tool_names.append(e.tool)
+            tool_events.setdefault(e.tool, []).append(e)
 
     # expect_tools
     if case.expect_tools:
-        missing_tools = set(case.expect_tools) - set(tool_names)
+        missing_tools = set(case.expect_tools) - tool_events.keys()
         if missing_tools:
             failures.append(
                 f"Missing required tool calls: {', '.join(missing_tools)} (actual: {tool_names})"
@@ -482,31 +636,48 @@ def check_assertions(
             "missing": sorted(missing_tools),
         }
 
+    if fail_fast and failures:
+        return False, failures, checks
+
     # expect_tools_ordered
     if case.expect_tools_ordered:
+        order_passed = True
         if case.expect_tools_ordered_strict:
             # EXACT ：
             if tool_names != case.expect_tools_ordered:
                 failures.append(
                     f"Tool order mismatch (strict):  {case.expect_tools_ordered}， {tool_names}"
                 )
+                order_passed = False
         else:
             # IN_ORDER ：，
-            it = iter(tool_names)
-            if not all(tool in it for tool in case.expect_tools_ordered):
+            expected = case.expect_tools_ordered
+            idx = 0
+            # A tool that was never called can't appear in order; skip the walk
+            if tool_events.keys() >= set(expected):
+                for tool in tool_names:
+                    if idx == len(expected):
+                        break
+                    if tool == expected[idx]:
+                        idx += 1
+            if idx != len(expected):
                 failures.append(
                     f"Tool order mismatch:  {case.expect_tools_ordered}， {tool_names}"
                 )
+                order_passed = False
         checks["tool_ordered"] = {
-            "passed": not any("Tool order mismatch" in f for f in failures),
+            "passed": order_passed,
             "expected": case.expect_tools_ordered,
             "actual": tool_names,
             "strict": case.expect_tools_ordered_strict,
         }
 
+    if fail_fast and failures:
+        return False, failures, checks
+
     # forbidden_tools
     if case.forbidden_tools:
-        forbidden_used = set(case.forbidden_tools) & set(tool_names)
+        forbidden_used = set(case.forbidden_tools) & tool_events.keys()
         if forbidden_used:
             failures.append(f"Forbidden tool was called: {', '.join(forbidden_used)}")
         checks["forbidden_tools"] = {
@@ -515,6 +686,9 @@ def check_assertions(
             "violations": sorted(forbidden_used),
         }
 
+    if fail_fast and failures:
+        return False, failures, checks
+
     exec_commands = _get_exec_commands(events)
 
     if case.expect_commands:
@@ -528,6 +702,9 @@ def check_assertions(
                 f"Missing expected command keywords: {', '.join(missing_patterns)}"
             )
 
+    if fail_fast and failures:
+        return False, failures, checks
+
     if case.forbidden_commands:
         forbid_check = _check_forbidden_commands(exec_commands, case.forbidden_commands)
         checks["forbidden_commands"] = forbid_check
@@ -536,6 +713,9 @@ def check_assertions(
                 f"Forbidden command keywords found: {', '.join(forbid_check['violations'].keys())}"
             )
 
+    if fail_fast and failures:
+        return False, failures, checks
+
     if case.expect_commands_ordered:
         order_check = _check_commands_ordered(
             exec_commands, case.expect_commands_ordered
@@ -546,12 +726,14 @@ def check_assertions(
                 f"Command order mismatch:  {case.expect_commands_ordered}， {order_check['matched_count']}/{order_check['expected_count']}"
             )
 
+    if fail_fast and failures:
+        return False, failures, checks
+
     # expect_output_contains
     if case.expect_output_contains:
-        output_lower = final_output.lower()
-        missing_keywords = [
-            kw for kw in case.expect_output_contains if kw.lower() not in output_lower
-        ]
+        missing_keywords = _missing_keywords(
+            final_output.lower(), case.expect_output_contains
+        )
         if missing_keywords:
             failures.append(
                 f"Output missing expected keywords: {', '.join(missing_keywords)}"
@@ -562,15 +744,16 @@ def check_assertions(
             "missing": missing_keywords,
         }
 
+    if fail_fast and failures:
+        return False, failures, checks
+
     # expect_tool_args
     if case.expect_tool_args:
         tool_arg_details: dict[str, Any] = {}
         tool_arg_passed = True
         for tool_name, expected_args in case.expect_tool_args.items():
             #  event
-            actual_events = [
-                e for e in events if e.kind == "tool_end" and e.tool == tool_name
-            ]
+            actual_events = tool_events.get(tool_name, [])
             if not actual_events:
                 failures.append(
                     f"Tool not called; cannot validate arguments: {tool_name}"
@@ -579,20 +762,28 @@ def check_assertions(
                 tool_arg_passed = False
                 continue
             tool_arg_details[tool_name] = {"passed": True, "args": {}}
-            for key, expected_val in expected_args.items():
-                matched = False
-                for ev in actual_events:
-                    actual_val = (
-                        ev.input.get(key) if isinstance(ev.input, dict) else None
+            # Stringify and case-fold each call's arguments once, not per key
+            actual_args = [
+                (
+                    {k: str(v) for k, v in ev.input.items()}
+                    if isinstance(ev.input, dict)
+                    else {}
+                )
+                for ev in actual_events
+            ]
+            actual_args_lower = [
+                {k: v.lower() for k, v in args.items()} for args in actual_args
+            ]
+            for key, expected_val, needle, substring in case.tool_arg_checks[tool_name]:
+                # Missing arguments compare as str(None)
+                if substring:
+                    matched = any(
+                        needle in args.get(key, "none") for args in actual_args_lower
+                    )
+                else:
+                    matched = any(
+                        args.get(key, "None") == needle for args in actual_args
                     )
-                    if isinstance(expected_val, str):
-                        if expected_val.lower() in str(actual_val).lower():
-                            matched = True
-                            break
-                    else:
-                        if str(actual_val) == str(expected_val):
-                            matched = True
-                            break
                 tool_arg_details[tool_name]["args"][key] = {
                     "expected": expected_val,
                     "matched": matched,
@@ -613,6 +804,9 @@ def check_assertions(
             "details": tool_arg_details,
         }
 
+    if fail_fast and failures:
+        return False, failures, checks
+
     # max_retries
     if case.max_retries is not None:
         retry_check = _check_retries(events, case.max_retries)
@@ -622,6 +816,9 @@ def check_assertions(
                 f"Too many retries: max consecutive {retry_check['max_consecutive']} > limit {case.max_retries}"
             )
 
+    if fail_fast and failures:
+        return False, failures, checks
+
     # expect_actions (Gap 1: Tool Selection Semantics)
     if case.expect_actions or case.expect_actions_ordered:
         classifier = ActionClassifier(
@@ -647,6 +844,9 @@ def check_assertions(
                     f"matched {order_check['matched_count']}/{order_check['expected_count']}"
                 )
 
+    if fail_fast and failures:
+        return False, failures, checks
+
     # expect_plan_contains (Gap 2: Reasoning/Planning Alignment)
     if case.expect_plan_contains:
         plan_check = _check_plan_contains(events, case.expect_plan_contains)
@@ -662,6 +862,9 @@ def check_assertions(
                     f"Plan text missing keywords: {', '.join(plan_check['missing'])}"
                 )
 
+    if fail_fast and failures:
+        return False, failures, checks
+
     # Judge (Gap 3: Final Response Semantic Evaluation)
     if case.judge_criteria and case.judge_model:
         from .judge import judge_case
@@ -724,6 +927,7 @@ def run_eval_case(
     log_dir: str,
     use_local: bool = False,
     session_id_override: str | None = None,
+    fail_fast: bool = False,
 ) -> EvalResult:
     """Run a single test case"""
     start_time = time.time()
@@ -770,7 +974,9 @@ def run_eval_case(
             break
 
     # Check assertions
-    passed, failures, checks = check_assertions(case, events, final_output)
+    passed, failures, checks = check_assertions(
+        case, events, final_output, fail_fast=fail_fast
+    )
 
     # Extract session metadata and aggregate usage from llm_turn events
     metadata = session_reader.extract_session_metadata(session_id) if session_id else {}
@@ -810,6 +1016,7 @@ def run_eval_case_pass_at_k(
     dry_run: bool,
     log_dir: str,
     use_local: bool = False,
+    fail_fast: bool = False,
 ) -> EvalResult:
     """Run a case K times and return an aggregated EvalResult.
 
@@ -818,7 +1025,7 @@ def run_eval_case_pass_at_k(
     """
     attempts: list[EvalResult] = []
     for _ in range(k):
-        attempt = run_eval_case(case, dry_run, log_dir, use_local)
+        attempt = run_eval_case(case, dry_run, log_dir, use_local, fail_fast=fail_fast)
         attempts.append(attempt)
 
     passes = sum(1 for a in attempts if a.passed)
@@ -890,13 +1097,17 @@ def _events_from_state(state: dict, session_id: str) -> list[Event]:
     return events
 
 
-def generate_html_report(results: list[EvalResult], output_file: str) -> None:
-    """Generate HTML report."""
-    passed_count = sum(1 for r in results if r.passed)
-    total_count = len(results)
-    pass_rate = (passed_count / total_count * 100) if total_count > 0 else 0
+def write_json_report(results: list[EvalResult], output_file: str) -> None:
+    """Write the JSON report, serializing one result at a time."""
+    with open(output_file, "wb") as f:
+        f.write(b"[")
+        for i, result in enumerate(results):
+            f.write(b",\n" if i else b"\n")
+            f.write(dumps_bytes(result.to_dict()))
+        f.write(b"\n]\n")
+
 
-    html = f"""<!DOCTYPE html>
+_HTML_HEADER = """<!DOCTYPE html>
 <html>
 <head>
     <meta charset="utf-8">
@@ -919,47 +1130,176 @@ def generate_html_report(results: list[EvalResult], output_file: str) -> None:
     <div class="summary">
         <strong>Total:</strong> {total_count} cases<br>
         <strong>Passed:</strong> <span class="pass">{passed_count}</span><br>
-        <strong>Failed:</strong> <span class="fail">{total_count - passed_count}</span><br>
+        <strong>Failed:</strong> <span class="fail">{failed_count}</span><br>
         <strong>Passed:</strong> {pass_rate:.1f}%
     </div>
 """
 
-    for result in results:
-        status_class = "pass" if result.passed else "fail"
-        badge_class = "badge-pass" if result.passed else "badge-fail"
-        status_text = "PASS" if result.passed else "FAIL"
+_HTML_FOOTER = """
+</body>
+</html>
+"""
+
+
+def _render_case(result: EvalResult) -> str:
+    """Render one case as an HTML fragment, escaping user content."""
+    badge_class = "badge-pass" if result.passed else "badge-fail"
+    status_text = "PASS" if result.passed else "FAIL"
 
-        html += f"""
+    tool_chain = ", ".join(result.tool_names) if result.tool_names else "()"
+    parts = [f"""
     <div class="case">
-        <h3>{result.case.id} <span class="badge {badge_class}">{status_text}</span></h3>
-        <p><strong>Message:</strong> {result.case.message}</p>
+        <h3>{escape(result.case.id)} <span class="badge {badge_class}">{status_text}</span></h3>
+        <p><strong>Message:</strong> {escape(result.case.message)}</p>
         <p><strong>Duration:</strong> {result.duration_s:.2f}s</p>
-        <p><strong>Tool chain:</strong> {', '.join(result.tool_names) if result.tool_names else '()'}</p>
-"""
+        <p><strong>Tool chain:</strong> {escape(tool_chain)}</p>
+"""]
+
+    if result.failures:
+        parts.append("        <p><strong class='fail'>Failed:</strong></p><ul>")
+        parts.extend(f"<li>{escape(failure)}</li>" for failure in result.failures)
+        parts.append("</ul>")
+
+    if result.final_output:
+        parts.append(
+            "        <p><strong>Output:</strong></p>"
+            f"<pre>{escape(result.output_preview)}</pre>"
+        )
+
+    parts.append("    </div>")
+    return "".join(parts)
+
+
+def generate_html_report(results: list[EvalResult], output_file: str) -> None:
+    """Generate HTML report."""
+    passed_count = sum(1 for r in results if r.passed)
+    total_count = len(results)
+    pass_rate = (passed_count / total_count * 100) if total_count > 0 else 0
 
-        if result.failures:
-            html += "        <p><strong class='fail'>Failed:</strong></p><ul>"
-            for failure in result.failures:
-                html += f"<li>{failure}</li>"
-            html += "</ul>"
-
-        if result.final_output:
-            output_preview = result.final_output[:200]
-            if len(result.final_output) > 200:
-                output_preview += "..."
-            html += (
-                f"        <p><strong>Output:</strong></p><pre>{output_preview}</pre>"
+    # Stream case by case so peak memory is one case, not the whole report
+    with open(output_file, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write(
+            _HTML_HEADER.format(
+                total_count=total_count,
+                passed_count=passed_count,
+                failed_count=total_count - passed_count,
+                pass_rate=pass_rate,
             )
+        )
+        for result in results:
+            f.write(_render_case(result))
+        f.write(_HTML_FOOTER)
 
-        html += "    </div>"
 
-    html += """
-</body>
-</html>
-"""
+def _case_pass_at_k(case: EvalCase, cli_pass_at_k: int | None) -> int:
+    """--pass-at-k overrides the per-case setting when provided."""
+    return cli_pass_at_k if cli_pass_at_k and cli_pass_at_k > 1 else case.pass_at_k
 
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(html)
+
+def _case_header(case: EvalCase, k: int) -> str:
+    k_label = f" [pass@{k}]" if k > 1 else ""
+    return f"→ {case.id}{k_label}: {case.message}"
+
+
+def _execute_case(
+    case: EvalCase, k: int, args: Any, validation_only: bool
+) -> EvalResult:
+    """Run one case according to the run command's options."""
+    if validation_only:
+        return EvalResult(
+            case=case,
+            passed=True,
+            events=[],
+            final_output="",
+            duration_s=0.0,
+            failures=[],
+            checks={},
+            session_id=None,
+            timestamp=datetime.now().isoformat(),
+        )
+    if k > 1:
+        return run_eval_case_pass_at_k(
+            case,
+            k,
+            args.dry_run,
+            args.log_dir,
+            getattr(args, "local", False),
+            fail_fast=getattr(args, "fail_fast", False),
+        )
+    return run_eval_case(
+        case,
+        args.dry_run,
+        args.log_dir,
+        getattr(args, "local", False),
+        getattr(args, "session", None),
+        fail_fast=getattr(args, "fail_fast", False),
+    )
+
+
+def _print_case_result(result: EvalResult, args: Any) -> None:
+    """Print the per-case status, tool chain, trace and failures."""
+    if result.pass_at_k_k > 1:
+        status = "✓ PASS" if result.passed else "✗ FAIL"
+        print(
+            f"  [{status}] pass@{result.pass_at_k_k}: "
+            f"{result.pass_at_k_passes}/{result.pass_at_k_k} "
+            f"({result.pass_at_k_rate * 100:.0f}%) "
+            f"total {result.duration_s:.1f}s"
+        )
+    elif result.passed:
+        print(f"  [✓ PASS] {result.duration_s:.1f}s")
+    else:
+        print(f"  [✗ FAIL] {result.duration_s:.1f}s")
+
+    # Tool chain
+    if result.tool_names:
+        print(f"  Tool chain: {', '.join(result.tool_names)}")
+    else:
+        print(f"  Tool chain: ()")
+
+    #  trace（）
+    if getattr(args, "show_trace", False) and result.events:
+        print(f"  \n  📋 Detailed trace:")
+        for i, event in enumerate(result.events, 1):
+            if event.kind == "tool_start":
+                print(f"    {i}. 🔧 {event.tool} start")
+                if event.input:
+                    input_str = str(event.input)[:100]
+                    if len(str(event.input)) > 100:
+                        input_str += "..."
+                    print(f"       input: {input_str}")
+            elif event.kind == "tool_end":
+                duration = f" ({event.duration_ms}ms)" if event.duration_ms else ""
+                print(f"    {i}. ✓ {event.tool} complete{duration}")
+                if event.output:
+                    output_str = str(event.output)[:100]
+                    if len(str(event.output)) > 100:
+                        output_str += "..."
+                    print(f"       Output: {output_str}")
+            elif event.kind == "llm_turn":
+                if event.stop_reason == "stop":
+                    text_str = event.text[:100] if event.text else ""
+                    if event.text and len(event.text) > 100:
+                        text_str += "..."
+                    print(f"    {i}. 💬 LLM response: {text_str}")
+                else:
+                    print(f"    {i}. 🧠 LLM decision ({event.model})")
+                    if event.thinking:
+                        thinking_str = event.thinking[:80]
+                        if len(event.thinking) > 80:
+                            thinking_str += "..."
+                        print(f"       Thinking: {thinking_str}")
+        print()
+
+    # Output（ trace）
+    if not getattr(args, "show_trace", False) and result.final_output:
+        print(f"  Output: {result.output_preview_short}")
+
+    if result.failures:
+        for failure in result.failures:
+            print(f"  ✗ {failure}")
+
+    print()
 
 
 def cmd_run(args: Any) -> None:
@@ -1014,161 +1354,122 @@ def cmd_run(args: Any) -> None:
     if validation_only:
         print("ℹ Dry-run  session，cases，Message\n")
 
-    # --pass-at-k overrides individual case settings when provided
     cli_pass_at_k = getattr(args, "pass_at_k", None)
 
-    results = []
-    for case in cases:
-        k = cli_pass_at_k if cli_pass_at_k and cli_pass_at_k > 1 else case.pass_at_k
-        k_label = f" [pass@{k}]" if k > 1 else ""
-        print(f"→ {case.id}{k_label}: {case.message}")
-
-        if validation_only:
-            result = EvalResult(
-                case=case,
-                passed=True,
-                events=[],
-                final_output="",
-                duration_s=0.0,
-                failures=[],
-                checks={},
-                session_id=None,
-                timestamp=datetime.now().isoformat(),
-            )
-        elif k > 1:
-            result = run_eval_case_pass_at_k(
-                case,
-                k,
-                args.dry_run,
-                args.log_dir,
-                getattr(args, "local", False),
-            )
-        else:
-            result = run_eval_case(
-                case,
-                args.dry_run,
-                args.log_dir,
-                getattr(args, "local", False),
-                getattr(args, "session", None),
-            )
-        results.append(result)
-
-        if result.pass_at_k_k > 1:
-            status = "✓ PASS" if result.passed else "✗ FAIL"
-            print(
-                f"  [{status}] pass@{result.pass_at_k_k}: "
-                f"{result.pass_at_k_passes}/{result.pass_at_k_k} "
-                f"({result.pass_at_k_rate * 100:.0f}%) "
-                f"total {result.duration_s:.1f}s"
-            )
-        elif result.passed:
-            print(f"  [✓ PASS] {result.duration_s:.1f}s")
-        else:
-            print(f"  [✗ FAIL] {result.duration_s:.1f}s")
-
-        # Tool chain
-        if result.tool_names:
-            print(f"  Tool chain: {', '.join(result.tool_names)}")
-        else:
-            print(f"  Tool chain: ()")
-
-        #  trace（）
-        if getattr(args, "show_trace", False) and result.events:
-            print(f"  \n  📋 Detailed trace:")
-            for i, event in enumerate(result.events, 1):
-                if event.kind == "tool_start":
-                    print(f"    {i}. 🔧 {event.tool} start")
-                    if event.input:
-                        input_str = str(event.input)[:100]
-                        if len(str(event.input)) > 100:
-                            input_str += "..."
-                        print(f"       input: {input_str}")
-                elif event.kind == "tool_end":
-                    duration = f" ({event.duration_ms}ms)" if event.duration_ms else ""
-                    print(f"    {i}. ✓ {event.tool} complete{duration}")
-                    if event.output:
-                        output_str = str(event.output)[:100]
-                        if len(str(event.output)) > 100:
-                            output_str += "..."
-                        print(f"       Output: {output_str}")
-                elif event.kind == "llm_turn":
-                    if event.stop_reason == "stop":
-                        text_str = event.text[:100] if event.text else ""
-                        if event.text and len(event.text) > 100:
-                            text_str += "..."
-                        print(f"    {i}. 💬 LLM response: {text_str}")
-                    else:
-                        print(f"    {i}. 🧠 LLM decision ({event.model})")
-                        if event.thinking:
-                            thinking_str = event.thinking[:80]
-                            if len(event.thinking) > 80:
-                                thinking_str += "..."
-                            print(f"       Thinking: {thinking_str}")
-            print()
-
-        # Output（ trace）
-        if not getattr(args, "show_trace", False) and result.final_output:
-            output_preview = result.final_output[:80]
-            if len(result.final_output) > 80:
-                output_preview += "..."
-            print(f"  Output: {output_preview}")
-
-        if result.failures:
-            for failure in result.failures:
-                print(f"  ✗ {failure}")
-
-        print()
+    results: list[EvalResult] = []
+    fail_fast = getattr(args, "fail_fast", False)
+    concurrency = max(1, getattr(args, "concurrency", 1) or 1)
+    if concurrency == 1 or len(cases) == 1:
+        for case in cases:
+            k = _case_pass_at_k(case, cli_pass_at_k)
+            print(_case_header(case, k))
+            result = _execute_case(case, k, args, validation_only)
+            results.append(result)
+            _print_case_result(result, args)
+            if fail_fast and not result.passed:
+                break
+    else:
+        # Cases are I/O bound (openclaw subprocess + log polling), so threads
+        # overlap the waits. Results print from this thread as they finish.
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {
+                executor.submit(
+                    _execute_case,
+                    case,
+                    _case_pass_at_k(case, cli_pass_at_k),
+                    args,
+                    validation_only,
+                ): case
+                for case in cases
+            }
+            for future in as_completed(futures):
+                case = futures[future]
+                print(_case_header(case, _case_pass_at_k(case, cli_pass_at_k)))
+                _print_case_result(future.result(), args)
+                if fail_fast and not future.result().passed:
+                    # Drop queued cases; ones already running still finish
+                    for pending in futures:
+                        pending.cancel()
+                    break
+        # Keep report order stable regardless of completion order
+        results = [future.result() for future in futures if not future.cancelled()]
+
+    if len(results) < len(cases):
+        print(
+            f"⚠ --fail-fast: stopped after first failure, "
+            f"{len(cases) - len(results)} case(s) not run"
+        )
 
-    # Summary
-    passed_count = sum(1 for r in results if r.passed)
+    # Summary: gather every aggregate in a single pass over results
     total_count = len(results)
+    passed_count = 0
+    total_duration = 0.0
+    total_input_tokens = 0
+    total_output_tokens = 0
+    total_cost = 0.0
+    all_models: set[str] = set()
+    all_providers: set[str] = set()
+    failed_cases: list[EvalResult] = []
+    # eval_type -> (passed, failed)
+    by_type: dict[str, tuple[list[EvalResult], list[EvalResult]]] = {
+        "regression": ([], []),
+        "capability": ([], []),
+    }
+    for r in results:
+        total_duration += r.duration_s
+        total_input_tokens += r.total_input_tokens
+        total_output_tokens += r.total_output_tokens
+        total_cost += r.total_cost
+        if r.model:
+            all_models.add(r.model)
+        if r.provider:
+            all_providers.add(r.provider)
+        bucket = by_type.get(r.case.eval_type)
+        if r.passed:
+            passed_count += 1
+            if bucket is not None:
+                bucket[0].append(r)
+        else:
+            failed_cases.append(r)
+            if bucket is not None:
+                bucket[1].append(r)
     pass_rate = (passed_count / total_count * 100) if total_count > 0 else 0
-    avg_duration = (
-        sum(r.duration_s for r in results) / total_count if total_count > 0 else 0
-    )
+    avg_duration = total_duration / total_count if total_count > 0 else 0
 
-    # Group stats by eval_type
-    regression_results = [r for r in results if r.case.eval_type == "regression"]
-    capability_results = [r for r in results if r.case.eval_type == "capability"]
+    passed_reg, failed_reg = by_type["regression"]
+    passed_cap, failed_cap = by_type["capability"]
 
     print("─" * 60)
 
-    if regression_results:
-        reg_passed = sum(1 for r in regression_results if r.passed)
-        reg_total = len(regression_results)
+    if passed_reg or failed_reg:
+        reg_passed = len(passed_reg)
+        reg_total = reg_passed + len(failed_reg)
         reg_rate = (reg_passed / reg_total * 100) if reg_total > 0 else 0
         print(f"📊 Regression Eval（Regression）")
         print("─" * 60)
         print(f"Passed: {reg_passed}/{reg_total}  ({reg_rate:.0f}%)")
         if reg_rate < 100:
             print("  ⚠ Below 100% needs attention")
-        failed_reg = [r for r in regression_results if not r.passed]
         if failed_reg:
             print(f"FAIL: {', '.join(r.case.id for r in failed_reg)}")
         print()
 
-    if capability_results:
-        cap_passed = sum(1 for r in capability_results if r.passed)
-        cap_total = len(capability_results)
+    if passed_cap or failed_cap:
+        cap_passed = len(passed_cap)
+        cap_total = cap_passed + len(failed_cap)
         cap_rate = (cap_passed / cap_total * 100) if cap_total > 0 else 0
         print(f"📈 Capability Eval（Capability）")
         print("─" * 60)
         print(f"Passed: {cap_passed}/{cap_total}  ({cap_rate:.0f}%)")
         print("  ℹ Normal; this is a climb metric")
-        passed_cap = [r for r in capability_results if r.passed]
         if passed_cap:
             print(f"PASS: {', '.join(r.case.id for r in passed_cap[:5])}")
             if len(passed_cap) > 5:
                 print(f"      ...  {len(passed_cap) - 5} ")
         print()
 
-    # Aggregate cost info across all results
-    all_models = set(r.model for r in results if r.model)
-    all_providers = set(r.provider for r in results if r.provider)
-    total_input_tokens = sum(r.total_input_tokens for r in results)
-    total_output_tokens = sum(r.total_output_tokens for r in results)
-    total_cost = sum(r.total_cost for r in results)
-
     print("─" * 60)
     print(f"complete: {passed_count}/{total_count} Passed ({pass_rate:.0f}%)")
 
@@ -1182,7 +1483,6 @@ def cmd_run(args: Any) -> None:
     if total_cost:
         print(f"Cost: ¥{total_cost:.4f}")
 
-    failed_cases = [r for r in results if not r.passed]
     if failed_cases:
         print(f"Failed {len(failed_cases)} :")
         for r in failed_cases:
@@ -1237,7 +1537,8 @@ def cmd_run(args: Any) -> None:
                 current_map = {r.case.id: r for r in results}
 
                 print("\nDetailed changes:")
-                for case_id in set(baseline_map.keys()) | set(current_map.keys()):
+                # Baseline order first, then cases new in this run
+                for case_id in {**baseline_map, **current_map}:
                     baseline = baseline_map.get(case_id)
                     current = current_map.get(case_id)
 
@@ -1257,12 +1558,9 @@ def cmd_run(args: Any) -> None:
 
                             # Tool chain
                             baseline_tools = baseline.get("tool_names", [])
-                            current_tools = [
-                                e.tool for e in current.events if e.kind == "tool_end"
-                            ]
-                            if baseline_tools != current_tools:
+                            if baseline_tools != current.tool_names:
                                 print(
-                                    f"     Tool chain: {baseline_tools} → {current_tools}"
+                                    f"     Tool chain: {baseline_tools} → {current.tool_names}"
                                 )
 
             except Exception as e:
@@ -1272,8 +1570,7 @@ def cmd_run(args: Any) -> None:
 
     # Output
     if args.output_json:
-        with open(args.output_json, "w", encoding="utf-8") as f:
-            json.dump([asdict(r) for r in results], f, indent=2, ensure_ascii=False)
+        write_json_report(results, args.output_json)
         print(f"\n✓ JSON report saved: {args.output_json}")
 
     if args.output_html:
@@ -0,0 +1,40 @@
+"""Optional fast JSON codec shared by session readers and report writers."""
+
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from typing import Any, Callable, cast
+
+# json.dumps with non-default options builds a new encoder per call; the
+# stdlib fallback reuses this one instead
+_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+
+@lru_cache(maxsize=None)
+def orjson_module() -> Any:
+    """Optional C JSON codec (pip install openclaw-edd[fast]), imported on first use."""
+    try:
+        import orjson
+    except ImportError:  # pragma: no cover - depends on environment
+        return None
+    return orjson
+
+
+def json_loader() -> Callable[[Any], Any]:
+    """Return orjson.loads when available, else json.loads (both accept bytes).
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    keep catching the stdlib exception.
+    """
+    codec = orjson_module()
+    return codec.loads if codec is not None else json.loads
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize obj as indented UTF-8 JSON."""
+    codec = orjson_module()
+    if codec is not None:
+        options = codec.OPT_INDENT_2 | codec.OPT_NON_STR_KEYS
+        return cast(bytes, codec.dumps(obj, option=options))
+    return _ENCODER.encode(obj).encode("utf-8")
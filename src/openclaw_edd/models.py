@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import datetime
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
+from functools import cached_property
+from typing import Any
 
 
 @dataclass
@@ -29,9 +32,25 @@ class Event:
     stop_reason: str = ""  # "toolUse" | "stop" | ""
     text: str = ""  # pure text output (stop turn)
 
+    def __post_init__(self) -> None:
+        # Few distinct kinds/tool names: share one object per value
+        if isinstance(self.kind, str):
+            self.kind = sys.intern(self.kind)
+        if isinstance(self.tool, str):
+            self.tool = sys.intern(self.tool)
+
     def to_dict(self) -> dict:
         """Convert to dict and drop empty values."""
-        return {k: v for k, v in self.__dict__.items() if v not in (None, {}, "")}
+        data = {}
+        for name in _EVENT_FIELDS:
+            value = getattr(self, name)
+            if value not in (None, {}, ""):
+                data[name] = value
+        return data
+
+
+# Resolved once; to_dict walks this instead of the instance __dict__
+_EVENT_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(Event))
 
 
 @dataclass
@@ -67,6 +86,49 @@ class EvalCase:
     judge_model: str = ""
     judge_provider: str = ""
 
+    def __post_init__(self) -> None:
+        # expect_tool_args prepared for matching once, when the case is loaded.
+        # Plain attributes, so to_dict and equality ignore them
+        self._tool_arg_source: dict[str, dict] = self.expect_tool_args
+        self._tool_arg_checks = _tool_arg_checks(self.expect_tool_args)
+
+    @property
+    def tool_arg_checks(self) -> dict[str, list[tuple[str, Any, str, bool]]]:
+        """expect_tool_args as (key, expected, needle, substring) per tool.
+
+        Rebuilt only if expect_tool_args has been reassigned since load.
+        """
+        if self._tool_arg_source is not self.expect_tool_args:
+            self._tool_arg_source = self.expect_tool_args
+            self._tool_arg_checks = _tool_arg_checks(self.expect_tool_args)
+        return self._tool_arg_checks
+
+    def to_dict(self) -> dict:
+        """Convert to a dict of all fields (shallow, unlike dataclasses.asdict)."""
+        return _field_dict(self)
+
+
+def _tool_arg_checks(
+    expect_tool_args: dict[str, dict],
+) -> dict[str, list[tuple[str, Any, str, bool]]]:
+    """Stringify expected tool arguments for matching, per tool.
+
+    Each argument becomes a ``(key, expected, needle, substring)`` tuple:
+    string values match as case-insensitive substrings (needle is
+    lowercased), anything else must equal ``str(expected)`` exactly.
+    """
+    return {
+        tool: [
+            (
+                (key, val, val.lower(), True)
+                if isinstance(val, str)
+                else (key, val, str(val), False)
+            )
+            for key, val in args.items()
+        ]
+        for tool, args in expect_tool_args.items()
+    }
+
 
 @dataclass
 class EvalResult:
@@ -91,8 +153,41 @@ class EvalResult:
     pass_at_k_passes: int = 0
     pass_at_k_rate: float = 0.0
     pass_at_k_session_ids: list = field(default_factory=list)
+    # Tool names from tool_end events, computed once from `events`
+    tool_names: list[str] = field(init=False, default_factory=list)
 
-    @property
-    def tool_names(self) -> list[str]:
-        """Return tool names from tool_end events."""
-        return [e.tool for e in self.events if e.kind == "tool_end"]
+    def __post_init__(self) -> None:
+        self.tool_names = [e.tool for e in self.events if e.kind == "tool_end"]
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-ready dict with the same shape as dataclasses.asdict.
+
+        Nested values are shared rather than deep-copied, so this is cheap
+        enough to call per result when writing reports.
+        """
+        data = _field_dict(self)
+        data["case"] = self.case.to_dict()
+        data["events"] = [_field_dict(e) for e in self.events]
+        return data
+
+    @cached_property
+    def output_preview(self) -> str:
+        """final_output truncated to 200 chars for reports."""
+        return _preview(self.final_output, 200)
+
+    @cached_property
+    def output_preview_short(self) -> str:
+        """final_output truncated to 80 chars for console output."""
+        return _preview(self.final_output, 80)
+
+
+def _field_dict(obj: Any) -> dict[str, Any]:
+    """Map a dataclass instance's fields to their current values."""
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+
+def _preview(text: str, maxlen: int) -> str:
+    """Truncate text to maxlen chars, appending "..." when cut."""
+    if len(text) > maxlen:
+        return text[:maxlen] + "..."
+    return text
@@ -3,14 +3,28 @@
 from __future__ import annotations
 
 import json
+import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Generator
+from typing import Any, Callable, Generator, Iterable
 
+from .jsoncodec import json_loader
 from .models import Event
 
 SESSION_DIR = Path.home() / ".openclaw" / "agents" / "main" / "sessions"
 
+# Record types read_session consumes (headers + messages); other records,
+# e.g. custom or compaction entries, are skipped without JSON parsing
+_SESSION_RECORD_RE = re.compile(
+    rb'"type"\s*:\s*"(?:message|session|model_change|thinking_level_change)"'
+)
+
+# tail_session_file poll interval: starts fast, backs off while the file is idle
+TAIL_POLL_MIN_S = 0.005
+TAIL_POLL_MAX_S = 0.2
+TAIL_POLL_BACKOFF = 1.5
+
 
 def resolve_latest_session(agent: str = "main") -> str | None:
     """Find the most recently modified session file."""
@@ -28,11 +42,15 @@ def get_session_file_path(session_id: str) -> Path:
     return SESSION_DIR / f"{session_id}.jsonl"
 
 
-def read_session_messages(session_id: str) -> Generator[dict, None, None]:
+def read_session_messages(
+    session_id: str, prefilter: re.Pattern[bytes] | None = None
+) -> Generator[dict, None, None]:
     """Yield messages from a session file.
 
     Args:
         session_id: Session ID.
+        prefilter: Optional bytes pattern; lines it doesn't match are
+            skipped without being parsed.
 
     Yields:
         Parsed JSON messages.
@@ -41,13 +59,17 @@ def read_session_messages(session_id: str) -> Generator[dict, None, None]:
     if not session_file.exists():
         return
 
-    with open(session_file, "r", encoding="utf-8") as f:
+    # Parse raw bytes: the decoder handles UTF-8 itself, no text-layer pass
+    loads = json_loader()
+    with open(session_file, "rb") as f:
         for line in f:
-            line = line.strip()
-            if not line:
+            # Both decoders accept the trailing newline, so no strip() copy
+            if line == b"\n":
+                continue
+            if prefilter is not None and not prefilter.search(line):
                 continue
             try:
-                yield json.loads(line)
+                yield loads(line)
             except json.JSONDecodeError:
                 continue
 
@@ -68,87 +90,101 @@ def extract_tool_call_info(message: dict) -> dict | None:
         return None
 
     msg = message.get("message", {})
-    role = msg.get("role")
-
-    if role == "assistant":
-        content = msg.get("content", [])
-
-        # Collect text, thinking, and tool calls separately
-        plan_text_parts = []
-        thinking_parts = []
-        tool_call_info = None
-
-        for item in content:
-            if item.get("type") == "text" and item.get("text"):
-                plan_text_parts.append(item.get("text").strip())
-            elif item.get("type") == "thinking" and item.get("thinking"):
+    handler = _ROLE_HANDLERS.get(msg.get("role"))
+    return handler(message, msg) if handler is not None else None
+
+
+def _handle_assistant(message: dict, msg: dict) -> dict | None:
+    """Assistant turn: first toolCall (with plan text) or an llm_response."""
+    content = msg.get("content", [])
+
+    # Collect text, thinking, and tool calls in a single walk over content
+    plan_text_parts = []
+    text_parts = []
+    thinking_parts = []
+    tool_call_info = None
+
+    for item in content:
+        item_type = item.get("type")
+        if item_type == "text":
+            text = item.get("text")
+            if text:
+                text = text.strip()
+                plan_text_parts.append(text)
+                text_parts.append(text)
+        elif item_type == "thinking":
+            thinking_text = item.get("thinking")
+            if thinking_text:
                 # Capture thinking content separately
-                thinking_text = item.get("thinking").strip()
+                thinking_text = thinking_text.strip()
                 thinking_parts.append(thinking_text)
                 # Also add to plan_text with prefix for backward compatibility
                 plan_text_parts.append(f"[thinking] {thinking_text}")
-            elif item.get("type") == "toolCall" and tool_call_info is None:
-                # Capture the first toolCall
-                tool_call_info = {
-                    "event": "tool_call",
-                    "tool": item.get("name"),
-                    "tool_call_id": item.get("id"),
-                    "arguments": item.get("arguments", {}),
-                    "timestamp": message.get("timestamp"),
-                    "message_id": message.get("id"),
-                }
-
-        # Prepare thinking and plan_text
-        thinking = "\n".join(thinking_parts)
-        plan_text = "\n".join(plan_text_parts)
-        # For llm_response: text should only contain actual text content, not thinking
-        text_only = "\n".join(
-            [p for p in plan_text_parts if not p.startswith("[thinking] ")]
-        )
-
-        # If we found a toolCall, return it with plan_text and thinking
-        if tool_call_info:
-            tool_call_info["plan_text"] = plan_text
-            tool_call_info["thinking"] = thinking
-            return tool_call_info
-
-        # No toolCall, but has text - return as llm_response
-        if plan_text_parts:
-            return {
-                "event": "llm_response",
-                "text": text_only,
-                "thinking": thinking,
+        elif item_type == "toolCall" and tool_call_info is None:
+            # Capture the first toolCall
+            tool_call_info = {
+                "event": "tool_call",
+                "tool": item.get("name"),
+                "tool_call_id": item.get("id"),
+                "arguments": item.get("arguments", {}),
                 "timestamp": message.get("timestamp"),
                 "message_id": message.get("id"),
-                "model": msg.get("model", ""),
-                "usage": msg.get("usage", {}),
             }
 
-    elif role == "toolResult":
-        content = msg.get("content", [])
-        text_content = ""
-        for item in content:
-            if item.get("type") == "text":
-                text_content = item.get("text", "")
-                break
+    thinking = "\n".join(thinking_parts)
+
+    # If we found a toolCall, return it with plan_text and thinking
+    if tool_call_info:
+        tool_call_info["plan_text"] = "\n".join(plan_text_parts)
+        tool_call_info["thinking"] = thinking
+        return tool_call_info
 
-        details = msg.get("details", {})
+    # No toolCall, but has text - return as llm_response
+    if plan_text_parts:
         return {
-            "event": "tool_result",
-            "tool": msg.get("toolName"),
-            "tool_call_id": msg.get("toolCallId"),
-            "output": text_content,
-            "duration_ms": details.get("durationMs", 0),
-            "status": details.get("status", ""),
-            "exit_code": details.get("exitCode"),
+            "event": "llm_response",
+            # Only actual text content, not thinking
+            "text": "\n".join(text_parts),
+            "thinking": thinking,
             "timestamp": message.get("timestamp"),
             "message_id": message.get("id"),
-            "parent_id": message.get("parentId"),
+            "model": msg.get("model", ""),
+            "usage": msg.get("usage", {}),
         }
-
     return None
 
 
+def _handle_tool_result(message: dict, msg: dict) -> dict:
+    """toolResult message: output text plus execution details."""
+    content = msg.get("content", [])
+    text_content = ""
+    for item in content:
+        if item.get("type") == "text":
+            text_content = item.get("text", "")
+            break
+
+    details = msg.get("details", {})
+    return {
+        "event": "tool_result",
+        "tool": msg.get("toolName"),
+        "tool_call_id": msg.get("toolCallId"),
+        "output": text_content,
+        "duration_ms": details.get("durationMs", 0),
+        "status": details.get("status", ""),
+        "exit_code": details.get("exitCode"),
+        "timestamp": message.get("timestamp"),
+        "message_id": message.get("id"),
+        "parent_id": message.get("parentId"),
+    }
+
+
+# message.role -> handler; other roles carry no tool-call info
+_ROLE_HANDLERS: dict[str, Callable[[dict, dict], dict | None]] = {
+    "assistant": _handle_assistant,
+    "toolResult": _handle_tool_result,
+}
+
+
 def tail_session_file(
     session_id: str, from_end: bool = True
 ) -> Generator[dict, None, None]:
@@ -168,21 +204,50 @@ def tail_session_file(
     while not session_file.exists():
         time.sleep(0.5)
 
-    with open(session_file, "r", encoding="utf-8") as f:
+    delay = TAIL_POLL_MIN_S
+    loads = json_loader()  # orjson when installed; both accept raw bytes
+    with open(session_file, "rb") as f:
         if from_end:
             f.seek(0, 2)
 
         while True:
             line = f.readline()
             if line:
-                line = line.strip()
-                if line:
+                delay = TAIL_POLL_MIN_S
+                if line != b"\n":
                     try:
-                        yield json.loads(line)
+                        yield loads(line)
                     except json.JSONDecodeError:
                         pass
             else:
-                time.sleep(0.05)
+                # Quiet file: back off so idle tails wake rarely, but snap
+                # back to fast polling as soon as data arrives
+                time.sleep(delay)
+                delay = min(TAIL_POLL_MAX_S, delay * TAIL_POLL_BACKOFF)
+
+
+def read_session(session_id: str) -> tuple[dict[str, Any], list[Event]]:
+    """Read header metadata and events from a session file in one pass.
+
+    Results are memoized per (file, mtime, size); an unchanged session file
+    is parsed once no matter how many commands ask for its events or metadata.
+
+    Args:
+        session_id: Session ID.
+
+    Returns:
+        (metadata, events) as returned by extract_session_metadata and
+        build_events_from_session.
+    """
+    session_file = get_session_file_path(session_id)
+    try:
+        st = session_file.stat()
+    except OSError:
+        return {}, []
+    metadata, events = _read_session_cached(
+        str(session_file), session_id, st.st_mtime_ns, st.st_size
+    )
+    return dict(metadata), list(events)
 
 
 def build_events_from_session(session_id: str) -> list[Event]:
@@ -196,10 +261,24 @@ def build_events_from_session(session_id: str) -> list[Event]:
         - llm_turn: represents one complete LLM call (with thinking, tool_calls/text, usage)
         - tool_end: follows each llm_turn that has tool_calls (binds to parent llm_turn)
     """
+    return read_session(session_id)[1]
+
+
+@lru_cache(maxsize=64)
+def _read_session_cached(
+    session_file: str, session_id: str, mtime_ns: int, size: int
+) -> tuple[dict[str, Any], tuple[Event, ...]]:
+    metadata, events = _read_session(session_id)
+    return metadata, tuple(events)
+
+
+def _read_session(session_id: str) -> tuple[dict[str, Any], list[Event]]:
     events: list[Event] = []
-    messages = list(read_session_messages(session_id))
+    messages = list(read_session_messages(session_id, _SESSION_RECORD_RE))
 
-    # Step 1: Build toolCallId -> toolResult message index
+    # Step 1: Collect header metadata (until the first message) and build
+    # the toolCallId -> toolResult message index
+    metadata = _metadata_from_records(messages)
     tool_results: dict[str, dict] = {}
     for msg in messages:
         if msg.get("type") != "message":
@@ -277,25 +356,37 @@ def build_events_from_session(session_id: str) -> list[Event]:
                     )
                 )
 
-    return events
+    return metadata, events
+
+
+def _metadata_from_records(records: Iterable[dict]) -> dict[str, Any]:
+    """Fold the header records before the first message into metadata."""
+    metadata: dict[str, Any] = {}
+    for record in records:
+        msg_type = record.get("type", "")
+        if msg_type == "message":
+            break
+        _apply_header(metadata, msg_type, record)
+    return metadata
+
+
+def _apply_header(metadata: dict[str, Any], msg_type: str, message: dict) -> None:
+    """Fold one session header event into metadata."""
+    if msg_type == "session":
+        metadata["cwd"] = message.get("cwd", "")
+        metadata["session_version"] = message.get("version")
+    elif msg_type == "model_change":
+        metadata["provider"] = message.get("provider", "")
+        metadata["model"] = message.get("modelId", "")
+    elif msg_type == "thinking_level_change":
+        metadata["thinking_level"] = message.get("thinkingLevel", "")
 
 
 def extract_session_metadata(session_id: str) -> dict[str, Any]:
     """Extract metadata from session header events.
 
+    Shares the memoized single-pass read with build_events_from_session.
+
     Returns dict with keys: model, provider, thinking_level, cwd, session_version.
     """
-    metadata: dict[str, Any] = {}
-    for message in read_session_messages(session_id):
-        msg_type = message.get("type", "")
-        if msg_type == "session":
-            metadata["cwd"] = message.get("cwd", "")
-            metadata["session_version"] = message.get("version")
-        elif msg_type == "model_change":
-            metadata["provider"] = message.get("provider", "")
-            metadata["model"] = message.get("modelId", "")
-        elif msg_type == "thinking_level_change":
-            metadata["thinking_level"] = message.get("thinkingLevel", "")
-        elif msg_type == "message":
-            break  # Stop after header events
-    return metadata
+    return read_session(session_id)[0]
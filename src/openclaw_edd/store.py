@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
-from typing import Any, cast
+from typing import Any
+
+from .jsoncodec import dumps_bytes
 
 EVAL_HOME = Path.home() / ".openclaw_eval"
 STATE_DIR = EVAL_HOME / "state"
@@ -14,9 +17,31 @@ STATE_DIR.mkdir(parents=True, exist_ok=True)
 ARTIFACTS_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# state_set appends deltas to a {session_id}.jsonl sidecar; the .json snapshot
+# is only rewritten (compacted) once the sidecar outgrows it
+COMPACT_RATIO = 4
+COMPACT_MIN_BYTES = 64 * 1024
+
+
+def _sidecar_path(session_id: str) -> Path:
+    return STATE_DIR / f"{session_id}.jsonl"
+
+
+def _set_path(state: dict, key: str, value: Any) -> None:
+    """Set a dotted key path (a.b.c) in state, creating parents."""
+    parts = key.split(".")
+    current = state
+    for part in parts[:-1]:
+        current = current.setdefault(part, {})
+    current[parts[-1]] = value
+
+
 def state_load(session_id: str) -> dict:
     """Load a session state file.
 
+    The snapshot is loaded first, then any deltas from the sidecar are
+    replayed on top of it.
+
     Args:
         session_id: Session ID.
 
@@ -24,19 +49,37 @@ def state_load(session_id: str) -> dict:
         State dict. Returns an empty dict if missing or invalid.
     """
     state_file = STATE_DIR / f"{session_id}.json"
-    if not state_file.exists():
-        return {}
+    sidecar = _sidecar_path(session_id)
+    state: dict[str, Any] = {}
+    if state_file.exists():
+        try:
+            with open(state_file, "r", encoding="utf-8") as f:
+                loaded = json.load(f)
+            state = loaded if isinstance(loaded, dict) else {}
+        except Exception:
+            state = {}
+    if not sidecar.exists():
+        return state
     try:
-        with open(state_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return cast(dict[str, Any], data)
-    except Exception:
-        return {}
+        with open(sidecar, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    delta = json.loads(line)
+                    _set_path(state, delta["k"], delta["v"])
+                except (json.JSONDecodeError, KeyError, TypeError, AttributeError):
+                    # Torn line, or a dotted key whose parent is not (or no
+                    # longer) an object
+                    continue
+    except OSError:
+        pass
+    return state
 
 
 def state_save(session_id: str, data: dict) -> None:
     """Save session state atomically.
 
+    Writes a full snapshot and drops the delta sidecar it supersedes.
+
     Args:
         session_id: Session ID.
         data: State data.
@@ -44,33 +87,55 @@ def state_save(session_id: str, data: dict) -> None:
     state_file = STATE_DIR / f"{session_id}.json"
     tmp_file = state_file.with_suffix(".tmp")
 
-    with open(tmp_file, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Encode straight to UTF-8 bytes, write them unbuffered and fsync before
+    # the rename so a crash leaves either the old or the new snapshot
+    payload = memoryview(dumps_bytes(data))
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(tmp_file, flags, 0o644)
+    try:
+        while payload:
+            payload = payload[os.write(fd, payload) :]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
-    tmp_file.rename(state_file)
+    # Drop the superseded deltas first: a crash between the two steps must
+    # not replay them over the new snapshot (resurrecting deleted keys)
+    _sidecar_path(session_id).unlink(missing_ok=True)
+    os.replace(tmp_file, state_file)
 
 
 def state_set(session_id: str, key: str, value: Any) -> None:
     """Set a key in state, supporting dotted paths.
 
+    Appends one delta line instead of rewriting the whole state; the
+    snapshot is compacted once the sidecar grows past COMPACT_RATIO times
+    its size.
+
     Args:
         session_id: Session ID.
         key: Key path (supports a.b.c format).
-        value: Value to set.
+        value: Value to set. A dotted key under a non-object value is
+            ignored when the state is loaded.
     """
-    state = state_load(session_id)
-
-    parts = key.split(".")
-    current = state
-    for part in parts[:-1]:
-        current = current.setdefault(part, {})
-
     try:
-        current[parts[-1]] = json.loads(value) if isinstance(value, str) else value
+        parsed = json.loads(value) if isinstance(value, str) else value
     except (json.JSONDecodeError, TypeError):
-        current[parts[-1]] = value
+        parsed = value
+
+    sidecar = _sidecar_path(session_id)
+    line = json.dumps({"k": key, "v": parsed}, ensure_ascii=False) + "\n"
+    with open(sidecar, "a", encoding="utf-8") as f:
+        f.write(line)
+
+    state_file = STATE_DIR / f"{session_id}.json"
+    snapshot_size = state_file.stat().st_size if state_file.exists() else 0
+    if sidecar.stat().st_size > max(COMPACT_RATIO * snapshot_size, COMPACT_MIN_BYTES):
+        state_save(session_id, state_load(session_id))
+
 
-    state_save(session_id, state)
+# (session dir, tool name) -> number of artifact files; seeded by one glob
+_artifact_counts: dict[tuple[str, str], int] = {}
 
 
 def artifacts_save(
@@ -90,13 +155,32 @@ def artifacts_save(
     session_dir = ARTIFACTS_DIR / session_id
     session_dir.mkdir(parents=True, exist_ok=True)
 
-    if version is None:
-        existing = list(session_dir.glob(f"{tool_name}_v*.txt"))
-        version = len(existing)
-
-    artifact_file = session_dir / f"{tool_name}_v{version}.txt"
-    with open(artifact_file, "w", encoding="utf-8") as f:
-        f.write(content)
+    key = (str(session_dir), tool_name)
+    count = _artifact_counts.get(key)
+    if count is None:
+        count = sum(1 for _ in session_dir.glob(f"{tool_name}_v*.txt"))
+
+    if version is not None:
+        artifact_file = session_dir / f"{tool_name}_v{version}.txt"
+        if not artifact_file.exists():
+            count += 1
+        with open(artifact_file, "w", encoding="utf-8") as f:
+            f.write(content)
+        _artifact_counts[key] = count
+        return artifact_file
+
+    # The cached count can be stale when another process saves artifacts for
+    # the same session: create exclusively and move past versions taken since
+    while True:
+        artifact_file = session_dir / f"{tool_name}_v{count}.txt"
+        count += 1
+        try:
+            with open(artifact_file, "x", encoding="utf-8") as f:
+                f.write(content)
+            break
+        except FileExistsError:
+            continue
+    _artifact_counts[key] = count
 
     return artifact_file
 
@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
-import json
 import os
 import re
 import time
-from collections import defaultdict
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, DefaultDict, Generator, Optional, TypedDict, cast
+from typing import Any, Generator, Iterator, Optional, TypedDict
 
+from .jsoncodec import json_loader
 from .models import Event
+from .session_reader import TAIL_POLL_BACKOFF, TAIL_POLL_MAX_S, TAIL_POLL_MIN_S
 
 # ============================================================================
 #
@@ -19,6 +20,14 @@ from .models import Event
 
 LOG_DIR = Path("/tmp/openclaw")
 LOG_GLOB = "openclaw-*.log"
+# Buffer for whole-file log scans: a few large reads instead of 8 KiB ones
+READ_BUFFER_BYTES = 1 << 20
+# Files at least this large are scanned in chunks instead of line by line
+CHUNK_SCAN_MIN_BYTES = 4 * 1024 * 1024
+# Below this much log data, starting worker processes costs more than it saves
+PARALLEL_SCAN_MIN_BYTES = 32 * 1024 * 1024
+# How often an idle tail_f looks for log rotation (date roll-over or new inode)
+ROTATION_CHECK_INTERVAL_S = 1.0
 
 TOOL_START_MSGS = {"embedded run tool start", "tool_start", "run tool start"}
 TOOL_END_MSGS = {"embedded run tool end", "tool_end", "run tool end"}
@@ -29,6 +38,8 @@ TURN_END_MSGS = {
     "turn end",
     "response sent",
 }
+# Substring match against any TURN_END_MSGS entry in one C-level search
+TURN_END_ANY_RE = re.compile("|".join(map(re.escape, sorted(TURN_END_MSGS))))
 
 
 class SessionStats(TypedDict):
@@ -54,6 +65,22 @@ TOOL_END_RE = re.compile(
 
 # ANSI
 ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+ANSI_BYTES_RE = re.compile(rb"\x1b\[[0-9;]*m")
+
+# A line can only yield a session_id through a "session_id" key or a
+# _meta message carrying sessionId=/runId=; anything else is skipped unparsed
+SESSION_MARKERS = (b"session", b"runId=")
+
+# Top-level string fields sessions_from_logs needs, read off a flat raw line
+FLAT_FIELD_RE = re.compile(rb'"(session_id|ts|agent|msg|event)"\s*:\s*"([^"]*)"')
+
+# key=value fields inside a _meta log message
+META_SESSION_ID_RE = re.compile(r"sessionId=([a-f0-9\-]+)")
+META_RUN_ID_RE = re.compile(r"runId=([a-f0-9\-]+)")
+META_TOOL_RE = re.compile(r"tool=(\w+)")
+
+# session_id values on a raw (undecoded) JSON log line
+SESSION_ID_BYTES_RE = re.compile(rb'"session_id"\s*:\s*"([^"]*)"')
 
 
 # ============================================================================
@@ -61,19 +88,31 @@ ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
 # ============================================================================
 
 
-def parse_line(line: str) -> Optional[dict[str, Any]]:
-    """Parse a single JSON log line into a normalized dict."""
-    line = ANSI_RE.sub("", line.strip())
+def parse_line(line: str | bytes) -> Optional[dict[str, Any]]:
+    """Parse a single JSON log line into a normalized dict.
+
+    Raw bytes are accepted so file scanners can skip the UTF-8 decode.
+    """
+    # Most lines carry no escape codes; skip the regex call for those
+    if isinstance(line, bytes):
+        line = line.strip()
+        if b"\x1b" in line:
+            line = ANSI_BYTES_RE.sub(b"", line)
+    else:
+        line = line.strip()
+        if "\x1b" in line:
+            line = ANSI_RE.sub("", line)
     if not line:
         return None
 
     try:
-        entry = json.loads(line)
+        entry = json_loader()(line)
         if not isinstance(entry, dict):
             return None
 
+        # Flat format, the common case: the decoded object is the entry
         if "_meta" not in entry:
-            return cast(dict[str, Any], entry)
+            return entry
 
         msg_text = entry.get("1", "")
         if not msg_text:
@@ -83,25 +122,19 @@ def parse_line(line: str) -> Optional[dict[str, Any]]:
 
         #  sessionId
         if "sessionId=" in msg_text:
-            import re
-
-            match = re.search(r"sessionId=([a-f0-9\-]+)", msg_text)
+            match = META_SESSION_ID_RE.search(msg_text)
             if match:
                 parsed["session_id"] = match.group(1)
 
         #  runId（）
         if "runId=" in msg_text and "session_id" not in parsed:
-            import re
-
-            match = re.search(r"runId=([a-f0-9\-]+)", msg_text)
+            match = META_RUN_ID_RE.search(msg_text)
             if match:
                 parsed["session_id"] = match.group(1)
 
         #  tool
         if "tool=" in msg_text:
-            import re
-
-            match = re.search(r"tool=(\w+)", msg_text)
+            match = META_TOOL_RE.search(msg_text)
             if match:
                 parsed["tool"] = match.group(1)
 
@@ -127,7 +160,7 @@ def parse_line(line: str) -> Optional[dict[str, Any]]:
 
         return None
 
-    except json.JSONDecodeError:
+    except ValueError:  # JSONDecodeError (stdlib or orjson), bad UTF-8
         return None
 
 
@@ -149,31 +182,158 @@ def read_all_logs(log_dir: Path = LOG_DIR, max_file_size_mb: int = 100) -> list[
     entries = []
     max_bytes = max_file_size_mb * 1024 * 1024
 
+    to_read = []
+    total_bytes = 0
     for log_file in log_files:
         try:
             file_size = log_file.stat().st_size
-            if file_size > max_bytes:
-                print(
-                    f"⚠ : {log_file.name} ({file_size / 1024 / 1024:.1f}MB > {max_file_size_mb}MB)"
-                )
-                print(f"  :  --session  trace  session")
-                continue
-
-            with open(log_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    entry = parse_line(line)
-                    if entry:
-                        entries.append(entry)
-        except Exception as e:
+        except OSError as e:
             print(f"⚠ : {log_file} - {e}")
+            continue
+        if file_size > max_bytes:
+            print(
+                f"⚠ : {log_file.name} ({file_size / 1024 / 1024:.1f}MB > {max_file_size_mb}MB)"
+            )
+            print(f"  :  --session  trace  session")
+            continue
+        to_read.append(log_file)
+        total_bytes += file_size
+
+    # Files parse independently and json.loads holds the GIL, so large
+    # multi-file scans go to worker processes; results keep file order
+    if len(to_read) > 1 and total_bytes >= PARALLEL_SCAN_MIN_BYTES:
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = min(len(to_read), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for file_entries in pool.map(_parse_log_file, to_read):
+                entries.extend(file_entries)
+    else:
+        for log_file in to_read:
+            entries.extend(_parse_log_file(log_file))
+
+    return entries
+
+
+def _scan_lines(log_file: Path) -> Iterator[bytes]:
+    """Raw lines of a log: chunk-scanned when large, readline otherwise."""
+    if log_file.stat().st_size >= CHUNK_SCAN_MIN_BYTES:
+        yield from _iter_file_lines(log_file)
+        return
+    with open(log_file, "rb", buffering=READ_BUFFER_BYTES) as f:
+        yield from f
 
+
+def _parse_log_file(log_file: Path) -> list[dict]:
+    """Parse every entry of one log file (read_all_logs worker)."""
+    entries = []
+    try:
+        for line in _scan_lines(log_file):
+            entry = parse_line(line)
+            if entry:
+                entries.append(entry)
+    except Exception as e:
+        print(f"⚠ : {log_file} - {e}")
     return entries
 
 
+def _mentions_session(raw: bytes) -> bool:
+    """Cheap substring check run before json.loads on a raw log line."""
+    return any(marker in raw for marker in SESSION_MARKERS)
+
+
+def _flat_fields(raw: bytes) -> Optional[dict[str, str]]:
+    """Read aggregation fields from a flat JSON line without json.loads.
+
+    Only single-object lines with no nesting, escapes or ANSI codes qualify;
+    there every "key": "value" match is a top-level string field, and later
+    duplicates win as they would in json.loads. Anything else (including
+    _meta lines) returns None and must go through parse_line.
+    """
+    raw = raw.strip()
+    if (
+        not raw.startswith(b"{")
+        or not raw.endswith(b"}")
+        or raw.count(b"{") != 1
+        or b"\\" in raw
+        or b"\x1b" in raw
+    ):
+        return None
+    return {
+        key.decode("ascii"): value.decode("utf-8")
+        for key, value in FLAT_FIELD_RE.findall(raw)
+    }
+
+
+def _log_signature(log_dir: Path) -> tuple[tuple[str, int, int], ...]:
+    """(name, mtime_ns, size) of every log file; changes whenever logs grow."""
+    signature = []
+    for log_file in sorted(log_dir.glob(LOG_GLOB)):
+        try:
+            st = log_file.stat()
+        except OSError:
+            continue
+        signature.append((log_file.name, st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
+
+def _iter_file_lines(path: Path) -> Iterator[bytes]:
+    """Yield raw lines (newline stripped) from READ_BUFFER_BYTES chunks.
+
+    Each chunk is split in one C-level pass instead of one readline per
+    line; the unterminated tail is carried into the next chunk. Plain reads
+    (rather than mmap) keep a log truncated mid-scan from faulting the process.
+    """
+    with open(path, "rb", buffering=0) as f:
+        carry = b""
+        while True:
+            chunk = f.read(READ_BUFFER_BYTES)
+            if not chunk:
+                break
+            lines = (carry + chunk).split(b"\n")
+            carry = lines.pop()
+            yield from lines
+        if carry:
+            yield carry
+
+
+@lru_cache(maxsize=256)
+def _read_session_entries(
+    log_file: str, session_id: str, mtime_ns: int, size: int
+) -> tuple[dict, ...]:
+    """Entries for one session from one log file.
+
+    mtime_ns and size are the cache fingerprint: appending to today's log
+    rescans only that file, older rotated logs stay cached.
+    """
+    entries = []
+    target = session_id.encode("utf-8")
+    try:
+        for raw in _iter_file_lines(Path(log_file)):
+            # Fast path: a matching id starts with the target, so a line
+            # without the target bytes, or whose visible session_id values
+            # all differ, is dropped without decoding or json.loads
+            if target:
+                if target not in raw:
+                    continue
+                sids = SESSION_ID_BYTES_RE.findall(raw)
+                if sids and not any(sid.startswith(target) for sid in sids):
+                    continue
+            entry = parse_line(raw)
+            if entry and entry.get("session_id", "").startswith(session_id):
+                entries.append(entry)
+    except Exception as e:
+        print(f"⚠ : {log_file} - {e}")
+    return tuple(entries)
+
+
 def read_logs_for_session(log_dir: Path, session_id: str) -> list[dict]:
     """
      session （）
 
+    Results are cached per log file by (mtime, size), so only log files
+    that changed since the last call are rescanned.
+
     Args:
         log_dir:
         session_id: Session ID
@@ -184,19 +344,11 @@ def read_logs_for_session(log_dir: Path, session_id: str) -> list[dict]:
     if not log_dir.exists():
         return []
 
-    log_files = sorted(log_dir.glob(LOG_GLOB))
-    entries = []
-
-    for log_file in log_files:
-        try:
-            with open(log_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    entry = parse_line(line)
-                    if entry and entry.get("session_id", "").startswith(session_id):
-                        entries.append(entry)
-        except Exception as e:
-            print(f"⚠ : {log_file} - {e}")
-
+    entries: list[dict] = []
+    for name, mtime_ns, size in _log_signature(log_dir):
+        entries.extend(
+            _read_session_entries(str(log_dir / name), session_id, mtime_ns, size)
+        )
     return entries
 
 
@@ -216,8 +368,7 @@ def _is_tool_end(entry: dict) -> bool:
 
 def _is_turn_end(entry: dict) -> bool:
     """turn"""
-    msg = entry.get("msg", "")
-    return any(end_msg in msg for end_msg in TURN_END_MSGS)
+    return TURN_END_ANY_RE.search(entry.get("msg", "")) is not None
 
 
 def entry_to_event(entry: dict, raw_line: str = "") -> Optional[Event]:
@@ -255,9 +406,9 @@ def entry_to_event(entry: dict, raw_line: str = "") -> Optional[Event]:
             raw=entry,
         )
 
-    elif any(k in entry for k in ["response", "answer", "content"]):
+    else:
         response_text = (
-            entry.get("response") or entry.get("answer") or entry.get("content", "")
+            entry.get("response") or entry.get("answer") or entry.get("content")
         )
         if response_text:
             return Event(
@@ -292,7 +443,11 @@ def extract_events(entries: list[dict], session_id: str = "") -> list[Event]:
         if session_id and not sid.startswith(session_id):
             continue
 
-        if _is_tool_start(entry):
+        # _is_tool_start/_is_tool_end inlined: one msg/event lookup per entry
+        msg = entry.get("msg", "")
+        event = entry.get("event", "")
+
+        if msg in TOOL_START_MSGS or event == "agent.run.tool_start":
             tool = entry.get("tool", "")
             events.append(
                 Event(
@@ -306,14 +461,14 @@ def extract_events(entries: list[dict], session_id: str = "") -> list[Event]:
             )
             pending[tool] = entry
 
-        elif _is_tool_end(entry):
+        elif msg in TOOL_END_MSGS or event == "agent.run.tool_end":
             tool = entry.get("tool", "")
-            start_entry = pending.pop(tool, {})
+            start_entry = pending.pop(tool, None)
             events.append(
                 Event(
                     kind="tool_end",
                     tool=tool,
-                    input=start_entry.get("input", {}),
+                    input=start_entry.get("input", {}) if start_entry else {},
                     output=entry.get("output", ""),
                     duration_ms=entry.get("duration"),
                     ts=entry.get("ts", ""),
@@ -322,9 +477,9 @@ def extract_events(entries: list[dict], session_id: str = "") -> list[Event]:
                 )
             )
 
-        elif any(k in entry for k in ["response", "answer", "content"]):
+        else:
             response_text = (
-                entry.get("response") or entry.get("answer") or entry.get("content", "")
+                entry.get("response") or entry.get("answer") or entry.get("content")
             )
             if response_text:
                 events.append(
@@ -340,57 +495,109 @@ def extract_events(entries: list[dict], session_id: str = "") -> list[Event]:
     return events
 
 
-def sessions_from_logs(log_dir: Path = LOG_DIR) -> list[SessionStats]:
-    """Aggregate session stats from logs."""
-    if not log_dir.exists():
-        return []
-
-    log_files = sorted(log_dir.glob(LOG_GLOB))
-    sessions: DefaultDict[str, SessionStats] = defaultdict(
-        lambda: {
-            "session_id": "",
-            "first_ts": "",
-            "last_ts": "",
-            "tool_count": 0,
-            "turns": 0,
-            "agent": "",
+class _SessionAgg:
+    """Running stats for one session; slotted, so no per-session dict."""
+
+    __slots__ = ("session_id", "first_ts", "last_ts", "tool_count", "turns", "agent")
+
+    def __init__(self, session_id: str) -> None:
+        self.session_id = session_id
+        self.first_ts = ""
+        self.last_ts = ""
+        self.tool_count = 0
+        self.turns = 0
+        self.agent = ""
+
+    def widen(self, first_ts: str, last_ts: str) -> None:
+        """Fold a [first_ts, last_ts] span into the session's time range."""
+        if not self.first_ts or first_ts < self.first_ts:
+            self.first_ts = first_ts
+        if not self.last_ts or last_ts > self.last_ts:
+            self.last_ts = last_ts
+
+    def merge(self, other: _SessionAgg) -> None:
+        """Add another file's stats for the same session."""
+        self.widen(other.first_ts, other.last_ts)
+        self.tool_count += other.tool_count
+        self.turns += other.turns
+        if not self.agent:
+            self.agent = other.agent
+
+    def to_stats(self) -> SessionStats:
+        return {
+            "session_id": self.session_id,
+            "first_ts": self.first_ts,
+            "last_ts": self.last_ts,
+            "tool_count": self.tool_count,
+            "turns": self.turns,
+            "agent": self.agent,
         }
-    )
 
-    for log_file in log_files:
-        try:
-            with open(log_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    entry = parse_line(line)
-                    if not entry:
-                        continue
 
-                    session_id = entry.get("session_id", "")
-                    if not session_id:
-                        continue
+@lru_cache(maxsize=64)
+def _file_session_stats(
+    log_file: str, mtime_ns: int, size: int
+) -> tuple[_SessionAgg, ...]:
+    """Session stats aggregated over one log file.
 
-                    session = sessions[session_id]
-                    session["session_id"] = session_id
+    Keyed like _read_session_entries, so repeated calls only rescan logs
+    that changed. The cached aggregates are shared and must not be mutated.
+    """
+    sessions: dict[str, _SessionAgg] = {}
+    try:
+        for line in _scan_lines(Path(log_file)):
+            if not _mentions_session(line):
+                continue
+            entry = _flat_fields(line)
+            if entry is None:
+                entry = parse_line(line)
+                if not entry:
+                    continue
+
+            session_id = entry.get("session_id", "")
+            if not session_id:
+                continue
+
+            # One probe per line; the id is set only on creation
+            session = sessions.get(session_id)
+            if session is None:
+                session = sessions[session_id] = _SessionAgg(session_id)
+
+            ts = entry.get("ts", "")
+            session.widen(ts, ts)
+
+            msg = entry.get("msg", "")
+            if msg in TOOL_END_MSGS or entry.get("event") == "agent.run.tool_end":
+                session.tool_count += 1
 
-                    ts = entry.get("ts", "")
-                    if not session["first_ts"] or ts < session["first_ts"]:
-                        session["first_ts"] = ts
-                    if not session["last_ts"] or ts > session["last_ts"]:
-                        session["last_ts"] = ts
+            if TURN_END_ANY_RE.search(msg):
+                session.turns += 1
 
-                    if _is_tool_end(entry):
-                        session["tool_count"] += 1
+            if not session.agent and "agent" in entry:
+                session.agent = entry["agent"]
 
-                    if _is_turn_end(entry):
-                        session["turns"] += 1
+    except Exception as e:
+        print(f"⚠ Failed to process log file: {log_file} - {e}")
+
+    return tuple(sessions.values())
+
+
+def sessions_from_logs(log_dir: Path = LOG_DIR) -> list[SessionStats]:
+    """Aggregate session stats from logs."""
+    if not log_dir.exists():
+        return []
 
-                    if not session["agent"] and "agent" in entry:
-                        session["agent"] = entry["agent"]
+    sessions: dict[str, _SessionAgg] = {}
 
-        except Exception as e:
-            print(f"⚠ Failed to process log file: {log_file} - {e}")
+    for name, mtime_ns, size in _log_signature(log_dir):
+        for stats in _file_session_stats(str(log_dir / name), mtime_ns, size):
+            session = sessions.get(stats.session_id)
+            if session is None:
+                session = sessions[stats.session_id] = _SessionAgg(stats.session_id)
+            session.merge(stats)
 
-    return sorted(sessions.values(), key=lambda x: x["last_ts"], reverse=True)
+    ordered = sorted(sessions.values(), key=lambda x: x.last_ts, reverse=True)
+    return [session.to_stats() for session in ordered]
 
 
 def tail_f(path: Path, from_end: bool = True) -> Generator[str, None, None]:
@@ -414,6 +621,8 @@ def tail_f(path: Path, from_end: bool = True) -> Generator[str, None, None]:
 
     current_inode = os.stat(path).st_ino
     current_date = date.today()
+    last_check = time.monotonic()
+    delay = TAIL_POLL_MIN_S
 
     with open(path, "r", encoding="utf-8") as f:
         if from_end:
@@ -423,10 +632,19 @@ def tail_f(path: Path, from_end: bool = True) -> Generator[str, None, None]:
             while True:
                 line = f.readline()
                 if line:
+                    delay = TAIL_POLL_MIN_S
                     yield line
                 else:
-                    #
-                    time.sleep(0.05)
+                    # Same idle backoff as tail_session_file: regular files
+                    # are always "readable" to select(), so polling it is
+                    time.sleep(delay)
+                    delay = min(TAIL_POLL_MAX_S, delay * TAIL_POLL_BACKOFF)
+
+                    # Rotation can wait a second; don't stat on every idle tick
+                    now = time.monotonic()
+                    if now - last_check < ROTATION_CHECK_INTERVAL_S:
+                        continue
+                    last_check = now
 
                     #
                     new_date = date.today()
@@ -483,17 +701,25 @@ def get_workspace(override: str = "") -> Path:
 
     #
     config_file = Path.home() / ".openclaw" / "openclaw.json"
-    if config_file.exists():
-        try:
-            with open(config_file, "r", encoding="utf-8") as f:
-                config = json.load(f)
-                workspace = (
-                    config.get("agents", {}).get("defaults", {}).get("workspace")
-                )
-                if workspace:
-                    return Path(workspace).expanduser()
-        except Exception:
-            pass
+    try:
+        mtime_ns = config_file.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    if mtime_ns is not None:
+        workspace = _configured_workspace(str(config_file), mtime_ns)
+        if workspace:
+            return Path(workspace).expanduser()
 
     # Fallback
     return Path.home() / ".openclaw" / "workspace"
+
+
+@lru_cache(maxsize=4)
+def _configured_workspace(config_file: str, mtime_ns: int) -> str:
+    """agents.defaults.workspace from openclaw.json, parsed once per mtime."""
+    try:
+        config = json_loader()(Path(config_file).read_bytes())
+        workspace = config.get("agents", {}).get("defaults", {}).get("workspace")
+    except Exception:
+        return ""
+    return workspace if isinstance(workspace, str) else ""
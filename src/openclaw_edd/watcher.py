@@ -5,18 +5,52 @@ from __future__ import annotations
 import argparse
 import json
 import os
+import re
 import signal
+import subprocess
 import sys
-from datetime import date
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
 from pathlib import Path
 from types import FrameType
+from typing import Any, BinaryIO, Callable
 
 from . import session_reader, store, tracer
+from .jsoncodec import json_loader
 
 # ============================================================================
 #
 # ============================================================================
 
+# Session directory poll interval: 100 ms while lines are arriving, backing
+# off to 1 s while every watched session is idle
+WATCH_POLL_MIN_S = 0.1
+WATCH_POLL_MAX_S = 1.0
+WATCH_POLL_BACKOFF = 1.5
+# Sessions polled each tick: all modified within the window, at least the
+# WATCH_MIN_SESSIONS most recent
+WATCH_ACTIVE_WINDOW_S = 30 * 60
+WATCH_MIN_SESSIONS = 10
+# Windows can't delete or rename a file while it is open, so session
+# handles are only kept across ticks on other platforms
+_KEEP_HANDLES = sys.platform != "win32"
+# Message ids remembered for de-duplication in a long-running watch
+PROCESSED_IDS_MAX = 50_000
+# Set in the environment of the detached `watch --daemon` child
+WATCH_CHILD_ENV = "OPENCLAW_WATCH_CHILD"
+
+# Noise stripped from user message text before display. Applied in order:
+# each ^-anchored prefix is matched against the already-cleaned text
+MESSAGE_ID_RE = re.compile(r"\[message_id:[^\]]*\]")
+SYSTEM_PREFIX_RE = re.compile(r"^System:.*?\n\n", re.DOTALL)
+GMT_PREFIX_RE = re.compile(r"^\[.*?GMT[+-]\d+\]\s*")
+
+# Roles _process_message acts on; other lines (session headers, model changes,
+# custom records) are skipped without JSON parsing
+WATCH_ROLE_RE = re.compile(rb'"role"\s*:\s*"(?:user|assistant|toolResult)"')
+
 
 def _cols() -> int:
     """， 100"""
@@ -26,15 +60,34 @@ def _cols() -> int:
         return 100
 
 
-def _bar(duration_ms: int, max_ms: int, width: int = 16) -> str:
+BAR_WIDTH = 16
+# Every possible bar at the default width, indexed by filled cell count
+_BARS = tuple("█" * i + "░" * (BAR_WIDTH - i) for i in range(BAR_WIDTH + 1))
+
+
+def _bar(duration_ms: int, max_ms: int, width: int = BAR_WIDTH) -> str:
     """， max_ms"""
     if max_ms <= 0 or duration_ms <= 0:
-        return "░" * width
-    ratio = min(duration_ms / max_ms, 1.0)
-    filled = round(ratio * width)
+        filled = 0
+    else:
+        filled = round(min(duration_ms / max_ms, 1.0) * width)
+    if width == BAR_WIDTH:
+        return _BARS[filled]
     return "█" * filled + "░" * (width - filled)
 
 
+def _parse_iso(ts: str) -> datetime:
+    """Parse an ISO-8601 timestamp, accepting a trailing "Z" on Python < 3.11."""
+    if ts.endswith("Z"):
+        ts = ts[:-1] + "+00:00"
+    return datetime.fromisoformat(ts)
+
+
+def _elapsed_ms(start_ts: str, end_ts: str) -> int:
+    """Milliseconds between two ISO-8601 timestamps."""
+    return int((_parse_iso(end_ts) - _parse_iso(start_ts)).total_seconds() * 1000)
+
+
 def _fmt_ms(ms: int) -> str:
     """"""
     if ms >= 1000:
@@ -44,7 +97,12 @@ def _fmt_ms(ms: int) -> str:
 
 def _truncate(text: str, maxlen: int) -> str:
     """"""
-    text = str(text).strip()
+    if not isinstance(text, str):
+        text = str(text)
+    # already-trimmed short text (the usual case) is returned as is
+    if len(text) <= maxlen and not (text[:1].isspace() or text[-1:].isspace()):
+        return text
+    text = text.strip()
     if len(text) > maxlen:
         return text[: maxlen - 3] + "..."
     return text
@@ -70,6 +128,9 @@ def _extract_args_summary(arguments: dict) -> str:
 def _render_invocation(session_id: str, invocation: dict) -> None:
     """invocation（ +  + ）"""
     cols = _cols()
+    # Lines are collected and written with one stdout call per invocation
+    out: list[str] = []
+    emit = out.append
 
     user_text = invocation.get("user_text", "")
     start_ts = invocation.get("start_ts", "")
@@ -87,10 +148,7 @@ def _render_invocation(session_id: str, invocation: dict) -> None:
     time_str = ""
     if start_ts:
         try:
-            from datetime import datetime, timezone
-
-            dt = datetime.fromisoformat(start_ts.replace("Z", "+00:00"))
-            dt_local = dt.astimezone()
+            dt_local = _parse_iso(start_ts).astimezone()
             time_str = dt_local.strftime("%H:%M:%S")
         except Exception:
             time_str = start_ts[11:19]
@@ -98,7 +156,7 @@ def _render_invocation(session_id: str, invocation: dict) -> None:
     header_mid = f" session {session_id[:8]}  {time_str} "
     left_dashes = "─── "
     right_dashes = "─" * max(0, cols - len(left_dashes) - len(header_mid))
-    print(f"{left_dashes}{header_mid}{right_dashes}")
+    emit(f"{left_dashes}{header_mid}{right_dashes}")
 
     # invocation ： +
     user_display = _truncate(user_text, 60) if user_text else "(system)"
@@ -106,28 +164,28 @@ def _render_invocation(session_id: str, invocation: dict) -> None:
     inv_line = f'invocation  "{user_display}"'
     if total_str:
         inv_line += f"  {total_str}"
-    print(inv_line)
-    print()
+    emit(inv_line)
+    emit("")
 
     # ──  ─────────────────────────────────────────────────
-    print("  └─ invoke_agent  main")
+    emit("  └─ invoke_agent  main")
 
     # （，）
     DUR_COL = 42
 
+    # Each branch looks up only the fields its event type carries
     for event in events:
         etype = event.get("type")
-        tool = event.get("tool", "")
         duration_ms = event.get("duration_ms", 0)
-        status = event.get("status", "")
-        in_text = event.get("in_text", "")
-        out_text = event.get("out_text", "")
-        reply_text = event.get("reply_text", "")
-        usage = event.get("usage", {})
 
         if etype == "tool":
+            tool = event.get("tool", "")
+            status = event.get("status", "")
+            in_text = event.get("in_text", "")
+            out_text = event.get("out_text", "")
+
             # call_llm （）
-            print("       call_llm")
+            emit("       call_llm")
 
             # execute_tool
             tool_label = f"       └─ execute_tool  {tool}"
@@ -140,16 +198,19 @@ def _render_invocation(session_id: str, invocation: dict) -> None:
                 bar_str = _bar(duration_ms, max_ms)
                 pad = max(1, DUR_COL - len(tool_label))
                 line = f"{tool_label}{' ' * pad}{dur_str}  {bar_str}"
-            print(line)
+            emit(line)
 
             if in_text:
-                print(f"            in:  {_truncate(in_text, 60)}")
+                emit(f"            in:  {_truncate(in_text, 60)}")
             if out_text and status != "running":
                 # running  out  "Command still running..." ，
-                print(f"            out: {_truncate(out_text, 80)}")
-            print()
+                emit(f"            out: {_truncate(out_text, 80)}")
+            emit("")
 
         elif etype == "llm_response":
+            reply_text = event.get("reply_text", "")
+            usage = event.get("usage", {})
+
             # call_llm ，（LLM ）
             left = "       call_llm"
             if duration_ms > 0:
@@ -159,7 +220,7 @@ def _render_invocation(session_id: str, invocation: dict) -> None:
                 line = f"{left}{' ' * pad}{dur_str}  {bar_str}"
             else:
                 line = left
-            print(line)
+            emit(line)
 
             if reply_text:
                 #  3  200 （）
@@ -182,23 +243,24 @@ def _render_invocation(session_id: str, invocation: dict) -> None:
 
                 for idx, line in enumerate(display_lines):
                     if idx == 0:
-                        print(f"            reply: {line}")
+                        emit(f"            reply: {line}")
                     else:
-                        print(f"                   {line}")
+                        emit(f"                   {line}")
             if usage:
                 tokens = f"in={usage.get('input', 0)} out={usage.get('output', 0)}"
                 if usage.get("cacheRead"):
                     tokens += f" cache={usage.get('cacheRead', 0)}"
-                print(f"            tokens: {tokens}")
-            print()
+                emit(f"            tokens: {tokens}")
+            emit("")
 
     # ──  ───────────────────────────────────────────────────
     total_label = f" total {_fmt_ms(total_ms)} " if total_ms > 0 else " "
     suffix = "──────────"
     right_part = f"{total_label}{suffix}"
     left_dashes_end = "─" * max(0, cols - len(right_part))
-    print(f"{left_dashes_end}{right_part}")
-    print()
+    emit(f"{left_dashes_end}{right_part}")
+    emit("")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 # ============================================================================
@@ -206,10 +268,60 @@ def _render_invocation(session_id: str, invocation: dict) -> None:
 # ============================================================================
 
 
+def _write_invocation_json(session_id: str, invocation: dict) -> None:
+    """Write a finished invocation as one compact JSON line (watch --format json)."""
+    record = {
+        "session_id": session_id,
+        "user_text": invocation.get("user_text", ""),
+        "start_ts": invocation.get("start_ts", ""),
+        "total_ms": invocation.get("total_ms", 0),
+        "events": invocation.get("events", []),
+    }
+    sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+    # Flush per record so piped consumers see each invocation immediately
+    sys.stdout.flush()
+
+
+def _newest_first(
+    directory: Path,
+    match: Callable[[str], bool],
+    limit: int | None = None,
+    modified_since: float | None = None,
+) -> list[Path]:
+    """Entries of directory whose name passes match, most recently modified first.
+
+    At most limit entries are returned, except that entries modified at or
+    after modified_since (epoch seconds) are always included.
+
+    One scandir pass: DirEntry caches its stat, so each file is stat'ed once
+    and Paths are built only for the entries returned. Files that vanish
+    mid-scan are skipped.
+    """
+    ranked = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if not match(entry.name):
+                    continue
+                try:
+                    ranked.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    continue
+    except OSError:
+        return []
+    ranked.sort(reverse=True)
+    if limit is not None and modified_since is not None:
+        active = sum(1 for mtime, _ in ranked if mtime >= modified_since)
+        limit = max(limit, active)
+    return [Path(path) for _, path in ranked[:limit]]
+
+
 def _find_latest_log(log_dir: Path) -> Path:
     """，fallback"""
-    logs = sorted(
-        log_dir.glob("openclaw-*.log"), key=lambda p: p.stat().st_mtime, reverse=True
+    logs = _newest_first(
+        log_dir,
+        lambda name: name.startswith("openclaw-") and name.endswith(".log"),
+        limit=1,
     )
     if logs:
         return logs[0]
@@ -221,265 +333,357 @@ def _find_latest_log(log_dir: Path) -> Path:
 # ============================================================================
 
 
-def _watch_session_files(args: argparse.Namespace, running: list[bool]) -> None:
-    """Watch session files and render invocations."""
-    from datetime import datetime
+class _BoundedSet:
+    """Set that forgets its oldest members beyond maxlen (FIFO eviction)."""
+
+    def __init__(self, maxlen: int) -> None:
+        self.maxlen = maxlen
+        self._items: OrderedDict[Any, None] = OrderedDict()
 
+    def __contains__(self, item: object) -> bool:
+        return item in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, item: Any) -> None:
+        self._items[item] = None
+        if len(self._items) > self.maxlen:
+            self._items.popitem(last=False)
+
+
+def _watch_session_files(args: argparse.Namespace, stop: threading.Event) -> None:
+    """Watch session files and render invocations."""
+    # Keep stdout for invocation records when it feeds another tool
+    log = sys.stderr if getattr(args, "format", "text") == "json" else sys.stdout
     sessions_dir = Path.home() / ".openclaw" / "agents" / "main" / "sessions"
     if not sessions_dir.exists():
-        print(f"✗ Session directory not found: {sessions_dir}")
+        print(f"✗ Session directory not found: {sessions_dir}", file=log)
         return
 
-    print(f"👁  Watching session files: {sessions_dir}")
+    print(f"👁  Watching session files: {sessions_dir}", file=log)
     if args.session:
-        print(f"   Filter session: {args.session}")
+        print(f"   Filter session: {args.session}", file=log)
 
     #  ID，
-    processed_messages: set[str] = set()
+    # Only guards against re-reading a recent tail, so old ids can be evicted
+    processed_messages = _BoundedSet(PROCESSED_IDS_MAX)
 
     #  session （）
     file_positions: dict[Path, int] = {}
+    # Open handle and inode per watched session, kept across ticks
+    open_files: dict[Path, tuple[BinaryIO, int]] = {}
 
     #  session  invocation
-    # session_id -> {user_text, start_ts, start_wall_ms, events, pending_tool_call}
+    # session_id -> {user_text, start_ts, start_wall_ms, events, pending_tool_calls}
     invocation_buffers: dict[str, dict] = {}
 
+    session_prefix = args.session or ""
+    delay = WATCH_POLL_MIN_S
+    loads = json_loader()  # orjson when installed; both accept raw bytes
+
     try:
-        import time
+        while not stop.is_set():
+            got_data = False
 
-        while running[0]:
             #  session
-            session_files = sorted(
-                sessions_dir.glob("*.jsonl"),
-                key=lambda p: p.stat().st_mtime,
-                reverse=True,
+            # Every session written to within the active window, and at least
+            # the WATCH_MIN_SESSIONS newest; filtered by --session before ranking
+            ranked = _newest_first(
+                sessions_dir,
+                lambda name: name.endswith(".jsonl")
+                and name[: -len(".jsonl")].startswith(session_prefix),
+                limit=WATCH_MIN_SESSIONS,
+                modified_since=time.time() - WATCH_ACTIVE_WINDOW_S,
             )
 
-            for session_file in session_files[:10]:  #  10  session
+            for session_file in ranked:
                 session_id = session_file.stem
 
-                #  session
-                if args.session and not session_id.startswith(args.session):
-                    continue
-
-                #
+                # Reuse the handle from earlier ticks; reopen only when the
+                # path now names a different file (rotated or replaced)
                 try:
-                    with open(session_file, "r", encoding="utf-8") as f:
-                        # ：，
-                        if not args.from_start:
-                            if session_file in file_positions:
-                                f.seek(file_positions[session_file])
-                            else:
-                                f.seek(0, 2)  # ：
-                                file_positions[session_file] = f.tell()
-                                continue
-
-                        for line in f:
-                            line = line.strip()
-                            if not line:
-                                continue
-
-                            try:
-                                message = json.loads(line)
-                                message_id = message.get("id")
-
-                                #
-                                if message_id in processed_messages:
-                                    continue
-                                processed_messages.add(message_id)
-
-                                _process_message(
-                                    message, session_id, args, invocation_buffers
-                                )
-
-                            except json.JSONDecodeError:
-                                continue
-
-                        #
-                        file_positions[session_file] = f.tell()
-
+                    st = os.stat(session_file)
+                    handle = open_files.get(session_file)
+                    if handle is None or handle[1] != st.st_ino:
+                        if handle is not None:
+                            handle[0].close()
+                            file_positions[session_file] = 0
+                        handle = (open(session_file, "rb"), st.st_ino)
+                        open_files[session_file] = handle
                 except FileNotFoundError:
                     continue
+                f = handle[0]
+
+                # ：，
+                position = file_positions.get(session_file)
+                if position is None:
+                    if not args.from_start:
+                        file_positions[session_file] = st.st_size  # ：
+                        continue
+                    position = 0
+                elif position > st.st_size:
+                    position = 0  # truncated in place
+                f.seek(position)
+
+                # One read per file per tick; a trailing partial line
+                # (writer mid-append) is left for the next tick
+                data = f.read()
+                if not _KEEP_HANDLES:
+                    open_files.pop(session_file)[0].close()
+                end = data.rfind(b"\n") + 1
+                if end:
+                    got_data = True
+                file_positions[session_file] = position + end
+
+                for line in data[:end].split(b"\n"):
+                    if not line or not WATCH_ROLE_RE.search(line):
+                        continue
+
+                    try:
+                        message = loads(line)
+                        message_id = message.get("id")
 
-            time.sleep(0.1)
+                        #
+                        if message_id in processed_messages:
+                            continue
+                        processed_messages.add(message_id)
+
+                        _process_message(message, session_id, args, invocation_buffers)
+
+                    except ValueError:  # bad JSON (either codec)
+                        continue
+
+            # Close handles of sessions that went idle or disappeared
+            if len(open_files) > len(ranked):
+                watched = set(ranked)
+                for path in [p for p in open_files if p not in watched]:
+                    open_files.pop(path)[0].close()
+
+            # Poll quickly while sessions are active, back off while idle
+            delay = (
+                WATCH_POLL_MIN_S
+                if got_data
+                else min(WATCH_POLL_MAX_S, delay * WATCH_POLL_BACKOFF)
+            )
+            # Returns early when a signal handler sets stop
+            stop.wait(delay)
 
     except KeyboardInterrupt:
         pass
+    finally:
+        for f, _ in open_files.values():
+            f.close()
 
-    print("\n✓ Watch stopped")
+    print("\n✓ Watch stopped", file=log)
 
 
-def _process_message(
-    message: dict,
+def _handle_user(
+    msg: dict,
+    ts: str,
     session_id: str,
     args: argparse.Namespace,
     invocation_buffers: dict,
 ) -> None:
-    """Process a single message and update invocation buffers."""
-    import time
+    """User message: start a new invocation for the session."""
+    # （ [message_id: ...] ）
+    user_text = ""
+    for item in msg.get("content", []):
+        if item.get("type") == "text":
+            raw = item.get("text", "")
+            #  [message_id: xxx]
+            raw = MESSAGE_ID_RE.sub("", raw).strip()
+            #  System: [...] （OpenClaw ）
+            raw = SYSTEM_PREFIX_RE.sub("", raw).strip()
+            #  [Sun 2026-03-01 02:41 GMT+8]
+            raw = GMT_PREFIX_RE.sub("", raw).strip()
+            user_text = raw.strip()
+            break
+
+    invocation_buffers[session_id] = {
+        "user_text": user_text,
+        "start_ts": ts,
+        "start_wall_ms": int(time.time() * 1000),
+        "events": [],
+        "pending_tool_calls": {},  # tool_call_id -> {tool, in_text, ts_start}
+    }
+
+
+def _handle_assistant(
+    msg: dict,
+    ts: str,
+    session_id: str,
+    args: argparse.Namespace,
+    invocation_buffers: dict,
+) -> None:
+    """Assistant turn: record tool calls, or finish the invocation on a reply."""
+    buf = invocation_buffers.get(session_id)
+    if buf is None:
+        #  invocation，
+        return
 
-    msg = message.get("message", {})
-    role = msg.get("role", "")
-    ts = message.get("timestamp", "")
+    # One pass: record every tool call (parallel calls included) by id and
+    # remember the first reply text, used only if there were no calls
+    pending_calls = buf["pending_tool_calls"]
+    saw_tool_call = False
+    reply_item = None
+    for item in msg.get("content", []):
+        item_type = item.get("type")
+        if item_type == "toolCall":
+            saw_tool_call = True
+            call_id = item.get("id", "")
+            pending_calls[call_id] = {
+                "tool": item.get("name", ""),
+                "tool_call_id": call_id,
+                "in_text": _extract_args_summary(item.get("arguments", {})),
+                "ts_start": ts,
+            }
+        elif item_type == "text" and reply_item is None and item.get("text"):
+            reply_item = item
+
+    if saw_tool_call:
+        return  #  tool_result  emit
+
+    if reply_item is not None:
+        # LLM  →  invocation
+        reply_text = reply_item["text"].strip()
+        usage = msg.get("usage", {})
+
+        #  LLM （ start_ts ，）
+        llm_dur = 0
+
+        buf["events"].append(
+            {
+                "type": "llm_response",
+                "reply_text": reply_text,
+                "usage": usage,
+                "duration_ms": llm_dur,
+            }
+        )
 
-    buf = invocation_buffers.get(session_id)
+        #
+        total_ms = 0
+        if buf.get("start_ts"):
+            try:
+                total_ms = _elapsed_ms(buf["start_ts"], ts)
+            except Exception:
+                pass
 
-    # ── ： invocation ──────────────────────────────────
-    if role == "user":
-        # （ [message_id: ...] ）
-        user_text = ""
-        for item in msg.get("content", []):
-            if item.get("type") == "text":
-                import re
-
-                raw = item.get("text", "")
-                #  [message_id: xxx]
-                raw = re.sub(r"\[message_id:[^\]]*\]", "", raw).strip()
-                #  System: [...] （OpenClaw ）
-                raw = re.sub(r"^System:.*?\n\n", "", raw, flags=re.DOTALL).strip()
-                #  [Sun 2026-03-01 02:41 GMT+8]
-                raw = re.sub(r"^\[.*?GMT[+-]\d+\]\s*", "", raw).strip()
-                user_text = raw.strip()
-                break
-
-        invocation_buffers[session_id] = {
-            "user_text": user_text,
-            "start_ts": ts,
-            "start_wall_ms": int(time.time() * 1000),
-            "events": [],
-            "pending_tool_call": None,  # {tool, in_text, ts_start}
-        }
+        buf["total_ms"] = total_ms
+
+        #
+        if getattr(args, "format", "text") == "json":
+            _write_invocation_json(session_id, buf)
+        else:
+            _render_invocation(session_id, buf)
+        del invocation_buffers[session_id]
         return
 
+
+def _handle_tool_result(
+    msg: dict,
+    ts: str,
+    session_id: str,
+    args: argparse.Namespace,
+    invocation_buffers: dict,
+) -> None:
+    """Tool result: pair with its pending tool call and add a tool event."""
+    buf = invocation_buffers.get(session_id)
     if buf is None:
         #  invocation，
         return
 
-    # ── assistant：tool_call  llm_response ─────────────────────────
-    if role == "assistant":
-        content = msg.get("content", [])
-
-        for item in content:
-            if item.get("type") == "toolCall":
-                # ：
-                tool_name = item.get("name", "")
-                arguments = item.get("arguments", {})
-                in_text = _extract_args_summary(arguments)
-                buf["pending_tool_call"] = {
-                    "tool": tool_name,
-                    "tool_call_id": item.get("id", ""),
-                    "in_text": in_text,
-                    "ts_start": ts,
-                }
-                return  #  tool_result  emit
-
-        for item in content:
-            if item.get("type") == "text" and item.get("text"):
-                # LLM  →  invocation
-                reply_text = item.get("text", "").strip()
-                usage = msg.get("usage", {})
-
-                #  LLM （ start_ts ，）
-                llm_dur = 0
-
-                buf["events"].append(
-                    {
-                        "type": "llm_response",
-                        "reply_text": reply_text,
-                        "usage": usage,
-                        "duration_ms": llm_dur,
-                    }
-                )
-
-                #
-                total_ms = 0
-                if buf.get("start_ts"):
-                    try:
-                        from datetime import datetime, timezone
-
-                        t0 = datetime.fromisoformat(
-                            buf["start_ts"].replace("Z", "+00:00")
-                        )
-                        t1 = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                        total_ms = int((t1 - t0).total_seconds() * 1000)
-                    except Exception:
-                        pass
-
-                buf["total_ms"] = total_ms
-
-                #
-                _render_invocation(session_id, buf)
-                del invocation_buffers[session_id]
-                return
-
-    # ── toolResult： pending_tool_call ───────────────────────────
-    elif role == "toolResult":
-        tool_name = msg.get("toolName", "")
-        details = msg.get("details", {})
-        status = details.get("status", "")
-        duration_ms = details.get("durationMs") or 0
+    tool_name = msg.get("toolName", "")
+    details = msg.get("details", {})
+    status = details.get("status", "")
+    duration_ms = details.get("durationMs") or 0
+
+    #
+    out_text = ""
+    for item in msg.get("content", []):
+        if item.get("type") == "text":
+            out_text = item.get("text", "").strip()
+            break
+
+    # Match by call id; results without one (or an unknown id) fall back
+    # to the oldest outstanding call
+    pending_calls = buf["pending_tool_calls"]
+    call_id = msg.get("toolCallId") or msg.get("toolUseId")
+    if call_id not in pending_calls:
+        call_id = next(iter(pending_calls), None)
+    pending = pending_calls.get(call_id) if call_id is not None else None
+
+    if status == "running":
+        # ： events， running
+        in_text = pending.get("in_text", "") if pending else ""
+        buf["events"].append(
+            {
+                "type": "tool",
+                "tool": tool_name,
+                "in_text": in_text,
+                "out_text": out_text,  #  "Command still running ..."
+                "duration_ms": 0,
+                "status": "running",
+            }
+        )
+        #  pending_tool_calls， completed
+        return
 
-        #
-        out_text = ""
-        for item in msg.get("content", []):
-            if item.get("type") == "text":
-                out_text = item.get("text", "").strip()
-                break
-
-        pending = buf.get("pending_tool_call")
-
-        if status == "running":
-            # ： events， running
-            in_text = pending.get("in_text", "") if pending else ""
-            buf["events"].append(
-                {
-                    "type": "tool",
-                    "tool": tool_name,
-                    "in_text": in_text,
-                    "out_text": out_text,  #  "Command still running ..."
-                    "duration_ms": 0,
-                    "status": "running",
-                }
-            )
-            #  pending_tool_call， completed
-            return
+    elif status in ("completed", "error", "") or status is None:
+        # （）
+        in_text = pending.get("in_text", "") if pending else ""
+
+        #  durationMs  0  ts_start，
+        if duration_ms == 0 and pending and pending.get("ts_start"):
+            try:
+                duration_ms = _elapsed_ms(pending["ts_start"], ts)
+            except Exception:
+                pass
+
+        buf["events"].append(
+            {
+                "type": "tool",
+                "tool": tool_name,
+                "in_text": in_text,
+                "out_text": out_text,
+                "duration_ms": duration_ms,
+                "status": status or "completed",
+            }
+        )
+
+        #  artifact（ --save-artifacts ）
+        if getattr(args, "save_artifacts", False) and out_text:
+            artifact_path = store.artifacts_save(session_id, tool_name, out_text)
+            if artifact_path:
+                pass  #  invocation ，
+
+        if call_id is not None:
+            del pending_calls[call_id]
+        return
 
-        elif status in ("completed", "error", "") or status is None:
-            # （）
-            in_text = pending.get("in_text", "") if pending else ""
 
-            #  durationMs  0  ts_start，
-            if duration_ms == 0 and pending and pending.get("ts_start"):
-                try:
-                    from datetime import datetime, timezone
-
-                    t0 = datetime.fromisoformat(
-                        pending["ts_start"].replace("Z", "+00:00")
-                    )
-                    t1 = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                    duration_ms = int((t1 - t0).total_seconds() * 1000)
-                except Exception:
-                    pass
-
-            buf["events"].append(
-                {
-                    "type": "tool",
-                    "tool": tool_name,
-                    "in_text": in_text,
-                    "out_text": out_text,
-                    "duration_ms": duration_ms,
-                    "status": status or "completed",
-                }
-            )
+_RoleHandler = Callable[[dict, str, str, argparse.Namespace, dict], None]
+
+# message.role -> handler; other roles are ignored
+_ROLE_HANDLERS: dict[str, _RoleHandler] = {
+    "user": _handle_user,
+    "assistant": _handle_assistant,
+    "toolResult": _handle_tool_result,
+}
 
-            #  artifact（ --save-artifacts ）
-            if getattr(args, "save_artifacts", False) and out_text:
-                artifact_path = store.artifacts_save(session_id, tool_name, out_text)
-                if artifact_path:
-                    pass  #  invocation ，
 
-            buf["pending_tool_call"] = None
-            return
+def _process_message(
+    message: dict,
+    session_id: str,
+    args: argparse.Namespace,
+    invocation_buffers: dict,
+) -> None:
+    """Process a single message and update invocation buffers."""
+    msg = message.get("message", {})
+    handler = _ROLE_HANDLERS.get(msg.get("role"))
+    if handler is not None:
+        ts = message.get("timestamp", "")
+        handler(msg, ts, session_id, args, invocation_buffers)
 
 
 # ============================================================================
@@ -490,34 +694,42 @@ def _process_message(
 def cmd_watch(args: argparse.Namespace) -> None:
     """Watch command entry."""
 
-    if args.daemon:
-        # Daemon
+    if args.daemon and os.environ.get(WATCH_CHILD_ENV) != "1":
+        # Daemon: re-run this command line in a detached child that writes to
+        # the log. Unlike fork() this works on Windows and copies nothing
+        child_kwargs: dict[str, Any] = {}
         if sys.platform == "win32":
-            print("✗ Daemon mode only supports Linux/macOS")
-            sys.exit(1)
-
-        pid = os.fork()
-        if pid > 0:
-            # Parent process: write PID file and exit
-            with open(args.pid_file, "w") as f:
-                f.write(str(pid))
-            print(f"✓ Watch daemon started (PID: {pid})")
-            print(f"  Log: {args.daemon_log}")
-            print(f"  Stop: kill $(cat {args.pid_file})")
-            sys.exit(0)
+            child_kwargs["creationflags"] = (
+                subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+            )
+        else:
+            child_kwargs["start_new_session"] = True
+
+        with open(args.daemon_log, "a", encoding="utf-8") as log:
+            child = subprocess.Popen(
+                [sys.executable, "-m", "openclaw_edd", *sys.argv[1:]],
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                env={**os.environ, WATCH_CHILD_ENV: "1"},
+                **child_kwargs,
+            )
 
-        os.setsid()
-        sys.stdout = open(args.daemon_log, "a", encoding="utf-8")
-        sys.stderr = sys.stdout
+        with open(args.pid_file, "w") as f:
+            f.write(str(child.pid))
+        print(f"✓ Watch daemon started (PID: {child.pid})")
+        print(f"  Log: {args.daemon_log}")
+        print(f"  Stop: kill $(cat {args.pid_file})")
+        sys.exit(0)
 
-    running = [True]
+    stop = threading.Event()
 
     def signal_handler(signum: int, frame: FrameType | None) -> None:
         """Handle termination signals for the watcher."""
-        running[0] = False
+        stop.set()
 
     signal.signal(signal.SIGTERM, signal_handler)
     signal.signal(signal.SIGINT, signal_handler)
 
     # Use session file mode with full input/output/duration.
-    _watch_session_files(args, running)
+    _watch_session_files(args, stop)
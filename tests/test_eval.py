@@ -1,5 +1,7 @@
 from datetime import datetime, timedelta, timezone
 
+import pytest
+
 from openclaw_edd import eval as eval_module
 from openclaw_edd.models import EvalCase, Event
 
@@ -83,6 +85,29 @@ def test_expect_tool_args_substring():
     assert checks["tool_args"]["passed"] is True
 
 
+def test_tools_ordered_in_order_and_strict():
+    events = [
+        _ev("read", "a", "2026-03-01T01:00:00Z"),
+        _ev("exec", "b", "2026-03-01T01:00:01Z"),
+        _ev("write", "c", "2026-03-01T01:00:02Z"),
+    ]
+    case = EvalCase(id="ordered", message="", expect_tools_ordered=["read", "write"])
+    passed, _, checks = eval_module.check_assertions(case, events, "")
+    assert passed
+    assert checks["tool_ordered"]["passed"] is True
+
+    case.expect_tools_ordered_strict = True
+    passed, failures, checks = eval_module.check_assertions(case, events, "")
+    assert not passed
+    assert checks["tool_ordered"]["passed"] is False
+    assert len(failures) == 1
+
+    case = EvalCase(id="ordered", message="", expect_tools_ordered=["write", "read"])
+    passed, _, checks = eval_module.check_assertions(case, events, "")
+    assert not passed
+    assert checks["tool_ordered"]["passed"] is False
+
+
 def test_session_isolation_time_window():
     base = datetime(2026, 3, 1, 1, 0, 0, tzinfo=timezone.utc)
     events = [
@@ -214,3 +239,417 @@ def test_load_cases_without_only_approved_loads_all(tmp_path):
 
     cases = eval_module.load_cases(str(f), only_approved=False)
     assert len(cases) == 2
+
+
+def test_output_contains_case_insensitive_and_duplicates():
+    case = EvalCase(
+        id="out",
+        message="",
+        expect_output_contains=["Shanghai", "shanghai", "rain"],
+    )
+    passed, failures, checks = eval_module.check_assertions(
+        case, [], "Sunny in SHANGHAI today"
+    )
+    assert not passed
+    assert checks["output_contains"]["missing"] == ["rain"]
+
+
+def test_expect_tool_args_non_string_and_multiple_calls():
+    events = [
+        Event(kind="tool_end", tool="read", input={"path": "/tmp/a", "limit": 5}),
+        Event(kind="tool_end", tool="read", input={"path": "/TMP/B", "limit": 10}),
+    ]
+    case = EvalCase(
+        id="tool_args",
+        message="",
+        expect_tool_args={"read": {"path": "/tmp/b", "limit": 10}},
+    )
+    passed, failures, checks = eval_module.check_assertions(case, events, "")
+    assert passed
+    assert checks["tool_args"]["details"]["read"]["args"]["limit"]["matched"]
+
+    case.expect_tool_args = {"read": {"limit": 7, "offset": 1}}
+    passed, failures, checks = eval_module.check_assertions(case, events, "")
+    assert not passed
+    assert len(failures) == 2
+
+
+def test_expect_tool_args_prepared_once_at_case_load():
+    case = EvalCase(
+        id="prepared",
+        message="",
+        expect_tool_args={"read": {"path": "/TMP", "limit": 10}},
+    )
+    prepared = case.tool_arg_checks
+    assert prepared == {
+        "read": [("path", "/TMP", "/tmp", True), ("limit", 10, "10", False)]
+    }
+    events = [Event(kind="tool_end", tool="read", input={"path": "/tmp", "limit": 10})]
+    assert eval_module.check_assertions(case, events, "")[0]
+    assert case.tool_arg_checks is prepared
+    assert "tool_arg_checks" not in case.to_dict()
+
+
+def _no_follow(*args, **kwargs):
+    raise FileNotFoundError("openclaw")
+
+
+def test_wait_for_completion_parses_only_new_lines(monkeypatch):
+    import subprocess
+
+    polls = [
+        '{"msg": "tool_start", "session_id": "s"}\n',
+        '{"msg": "tool_start", "session_id": "s"}\n'
+        '{"msg": "run finished", "session_id": "s"}\n',
+    ]
+    parsed = []
+
+    def fake_run(*args, **kwargs):
+        return subprocess.CompletedProcess(args, 0, stdout=polls.pop(0), stderr="")
+
+    real_parse_line = eval_module.parse_line
+
+    def counting_parse_line(line):
+        parsed.append(line)
+        return real_parse_line(line)
+
+    monkeypatch.setattr(eval_module.subprocess, "Popen", _no_follow)
+    monkeypatch.setattr(eval_module.subprocess, "run", fake_run)
+    monkeypatch.setattr(eval_module, "parse_line", counting_parse_line)
+    monkeypatch.setattr(eval_module.time, "sleep", lambda s: None)
+
+    assert eval_module.wait_for_completion("s", timeout_s=30, log_dir="/tmp")
+    assert len(parsed) == 2
+
+
+def test_send_message_extracts_session_id(monkeypatch):
+    import json
+    import subprocess
+
+    responses = [
+        {"result": {"meta": {"agentMeta": {"sessionId": "gw-1"}}}},
+        {"meta": {"agentMeta": {"sessionId": "local-1"}}},
+        {"result": "no meta here"},
+    ]
+
+    def fake_run(cmd, **kwargs):
+        stdout = json.dumps(responses.pop(0))
+        return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr="")
+
+    monkeypatch.setattr(eval_module.subprocess, "run", fake_run)
+
+    assert eval_module.send_message("main", "hi") == "gw-1"
+    assert eval_module.send_message("main", "hi", use_local=True) == "local-1"
+    assert eval_module.send_message("main", "hi") is None
+
+
+def test_load_cases_golden_assertions_skip_unknown_types():
+    from pathlib import Path
+
+    golden = Path(__file__).parent / "fixtures" / "sample_golden_v03.jsonl"
+    cases = eval_module.load_cases(str(golden))
+
+    assert len(cases) == 1
+    case = cases[0]
+    assert case.expect_tools == ["exec"]
+    assert case.expect_output_contains == ["slow query", "latency"]
+    assert case.forbidden_commands == []
+
+
+def test_generate_html_report(tmp_path):
+    case = EvalCase(id="weather", message="Weather in 上海?")
+    result = eval_module.EvalResult(
+        case=case,
+        passed=False,
+        events=[],
+        final_output="x" * 300,
+        duration_s=1.5,
+        failures=["Missing required tool calls: exec"],
+    )
+    out = tmp_path / "report.html"
+    eval_module.generate_html_report([result], str(out))
+
+    content = out.read_text(encoding="utf-8")
+    assert "上海" in content
+    assert "badge-fail" in content
+    assert "Missing required tool calls: exec" in content
+    assert "x" * 200 + "..." in content
+
+
+def test_cmd_run_concurrency_keeps_case_order(monkeypatch, tmp_path):
+    import argparse
+    import json
+    import time
+
+    delays = {"c1": 0.05, "c2": 0.0, "c3": 0.02}
+
+    def fake_run_eval_case(case, dry_run, log_dir, use_local=False, sid=None, **kw):
+        time.sleep(delays[case.id])
+        return eval_module.EvalResult(
+            case=case, passed=True, events=[], final_output="", duration_s=0.0
+        )
+
+    cases = [EvalCase(id=cid, message=cid) for cid in delays]
+    monkeypatch.setattr(eval_module, "load_cases", lambda *a, **kw: cases)
+    monkeypatch.setattr(eval_module, "run_eval_case", fake_run_eval_case)
+
+    report = tmp_path / "report.json"
+    args = argparse.Namespace(
+        case=None,
+        cases="cases.yaml",
+        tags=None,
+        dry_run=True,
+        session="s",
+        log_dir="/tmp",
+        concurrency=3,
+        output_json=str(report),
+        output_html=None,
+    )
+    eval_module.cmd_run(args)
+
+    ids = [r["case"]["id"] for r in json.loads(report.read_text())]
+    assert ids == ["c1", "c2", "c3"]
+
+
+def test_wait_for_completion_backs_off_with_since_cursor(monkeypatch):
+    import subprocess
+
+    clock = [1000.0]
+    sleeps = []
+    since_args = []
+
+    def fake_run(cmd, **kwargs):
+        since_args.append(cmd[-1])
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(eval_module.subprocess, "Popen", _no_follow)
+    monkeypatch.setattr(eval_module.subprocess, "run", fake_run)
+    monkeypatch.setattr(eval_module.time, "time", lambda: clock[0])
+    monkeypatch.setattr(eval_module.time, "sleep", fake_sleep)
+
+    assert eval_module.wait_for_completion("s", timeout_s=60, log_dir="/tmp")
+    assert sleeps[0] == eval_module.POLL_MIN_S
+    assert sleeps == sorted(sleeps)
+    assert max(sleeps) <= eval_module.POLL_MAX_S
+    # Each poll only asks for the window since the previous poll
+    assert all(arg in ("--since=1s", "--since=2s", "--since=3s") for arg in since_args)
+    assert sum(sleeps) >= eval_module.STABLE_QUIET_S
+
+
+def test_load_cases_reuses_parse_until_file_changes(tmp_path):
+    import os
+
+    pytest.importorskip("yaml")
+    f = tmp_path / "cases.yaml"
+    f.write_text("cases:\n  - {id: a, message: m, tags: [x]}\n")
+
+    first = eval_module.load_cases(str(f))
+    first[0].tags.append("mutated")
+    hits_before = eval_module._parse_yaml_cases.cache_info().hits
+    second = eval_module.load_cases(str(f))
+    assert eval_module._parse_yaml_cases.cache_info().hits == hits_before + 1
+    assert second[0].tags == ["x"]
+
+    f.write_text("cases:\n  - {id: b, message: changed}\n")
+    stat = f.stat()
+    os.utime(f, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert [c.id for c in eval_module.load_cases(str(f))] == ["b"]
+
+
+def test_write_json_report_round_trip(tmp_path, monkeypatch):
+    import json
+
+    results = [
+        eval_module.EvalResult(
+            case=EvalCase(id=cid, message="上海"),
+            passed=cid == "a",
+            events=[Event(kind="tool_end", tool="exec", input={"command": "ls"})],
+            final_output="ok",
+            duration_s=0.5,
+        )
+        for cid in ("a", "b")
+    ]
+    from openclaw_edd import jsoncodec
+
+    for codec in (jsoncodec.orjson_module(), None):
+        monkeypatch.setattr(jsoncodec, "orjson_module", lambda: codec)
+        out = tmp_path / "report.json"
+        eval_module.write_json_report(results, str(out))
+        data = json.loads(out.read_text(encoding="utf-8"))
+        assert [r["case"]["id"] for r in data] == ["a", "b"]
+        assert data[0]["case"]["message"] == "上海"
+        assert data[1]["tool_names"] == ["exec"]
+
+        eval_module.write_json_report([], str(out))
+        assert json.loads(out.read_text(encoding="utf-8")) == []
+
+
+def test_generate_html_report_escapes_user_content(tmp_path):
+    case = EvalCase(id="<id>", message="<script>alert(1)</script>")
+    result = eval_module.EvalResult(
+        case=case,
+        passed=True,
+        events=[],
+        final_output="a < b & c",
+        duration_s=0.1,
+    )
+    out = tmp_path / "report.html"
+    eval_module.generate_html_report([result], str(out))
+
+    content = out.read_text(encoding="utf-8")
+    assert "<script>" not in content
+    assert "&lt;script&gt;" in content
+    assert "a &lt; b &amp; c" in content
+
+
+def test_tools_ordered_uncalled_tool_fails():
+    events = [_ev("read", "a", "2026-03-01T01:00:00Z")]
+    case = EvalCase(id="ordered", message="", expect_tools_ordered=["read", "exec"])
+    passed, failures, checks = eval_module.check_assertions(case, events, "")
+    assert not passed
+    assert checks["tool_ordered"]["passed"] is False
+
+
+def test_wait_for_completion_follows_log_stream(monkeypatch):
+    import io
+
+    class FakeProc:
+        def __init__(self, cmd, **kwargs):
+            self.cmd = cmd
+            self.stdout = io.StringIO(
+                '{"msg": "tool_start", "session_id": "s"}\n'
+                '{"msg": "run finished", "session_id": "s"}\n'
+            )
+            self.killed = False
+            procs.append(self)
+
+        def kill(self):
+            self.killed = True
+
+        def wait(self):
+            return 0
+
+    procs = []
+
+    def no_polling(*args, **kwargs):
+        raise AssertionError("follow stream should not fall back to polling")
+
+    monkeypatch.setattr(eval_module.subprocess, "Popen", FakeProc)
+    monkeypatch.setattr(eval_module.subprocess, "run", no_polling)
+
+    assert eval_module.wait_for_completion("s", timeout_s=30, log_dir="/tmp")
+    assert len(procs) == 1
+    assert "--follow" in procs[0].cmd
+    assert procs[0].killed
+
+
+def test_cmd_run_summary_groups_by_eval_type(monkeypatch, capsys):
+    import argparse
+
+    outcomes = {"r1": True, "r2": False, "cap1": True}
+
+    def fake_run_eval_case(case, dry_run, log_dir, use_local=False, sid=None, **kw):
+        return eval_module.EvalResult(
+            case=case,
+            passed=outcomes[case.id],
+            events=[],
+            final_output="",
+            duration_s=2.0,
+            failures=[] if outcomes[case.id] else ["boom"],
+            total_cost=0.5,
+        )
+
+    cases = [
+        EvalCase(id="r1", message="m"),
+        EvalCase(id="r2", message="m"),
+        EvalCase(id="cap1", message="m", eval_type="capability"),
+    ]
+    monkeypatch.setattr(eval_module, "load_cases", lambda *a, **kw: cases)
+    monkeypatch.setattr(eval_module, "run_eval_case", fake_run_eval_case)
+
+    args = argparse.Namespace(
+        case=None,
+        cases="cases.yaml",
+        tags=None,
+        dry_run=True,
+        session="s",
+        log_dir="/tmp",
+        output_json=None,
+        output_html=None,
+    )
+    with pytest.raises(SystemExit):
+        eval_module.cmd_run(args)
+
+    out = capsys.readouterr().out
+    assert "Passed: 1/2  (50%)" in out
+    assert "FAIL: r2" in out
+    assert "Passed: 1/1  (100%)" in out
+    assert "PASS: cap1" in out
+    assert "complete: 2/3 Passed (67%)" in out
+    assert "Cost: ¥1.5000" in out
+    assert "  - r2: boom" in out
+    assert "Duration: 2.0s" in out
+
+
+def test_check_assertions_fail_fast_stops_at_first_failure():
+    case = EvalCase(
+        id="ff",
+        message="m",
+        expect_tools=["read"],
+        forbidden_tools=["exec"],
+        expect_tool_args={"read": {"path": "/etc"}},
+    )
+    events = [Event(kind="tool_end", tool="exec", input={"command": "ls"})]
+
+    passed, failures, checks = eval_module.check_assertions(case, events, "")
+    assert not passed
+    assert len(failures) == 3
+
+    passed, failures, checks = eval_module.check_assertions(
+        case, events, "", fail_fast=True
+    )
+    assert not passed
+    assert failures == ["Missing required tool calls: read (actual: ['exec'])"]
+    assert list(checks) == ["tool_called"]
+
+
+def test_cmd_run_fail_fast_stops_case_loop(monkeypatch, capsys):
+    import argparse
+
+    ran = []
+
+    def fake_run_eval_case(case, dry_run, log_dir, use_local=False, sid=None, **kw):
+        ran.append(case.id)
+        assert kw["fail_fast"] is True
+        return eval_module.EvalResult(
+            case=case,
+            passed=case.id != "c2",
+            events=[],
+            final_output="",
+            duration_s=0.0,
+        )
+
+    cases = [EvalCase(id=cid, message=cid) for cid in ("c1", "c2", "c3")]
+    monkeypatch.setattr(eval_module, "load_cases", lambda *a, **kw: cases)
+    monkeypatch.setattr(eval_module, "run_eval_case", fake_run_eval_case)
+
+    args = argparse.Namespace(
+        case=None,
+        cases="cases.yaml",
+        tags=None,
+        dry_run=True,
+        session="s",
+        log_dir="/tmp",
+        fail_fast=True,
+        output_json=None,
+        output_html=None,
+    )
+    with pytest.raises(SystemExit):
+        eval_module.cmd_run(args)
+
+    assert ran == ["c1", "c2"]
+    assert "1 case(s) not run" in capsys.readouterr().out
@@ -98,6 +98,13 @@ def test_event_to_dict_filters_empty_values():
     assert "output" not in data
 
 
+def test_event_interns_kind_and_tool():
+    a = Event(kind="".join(["tool", "_end"]), tool="".join(["ex", "ec"]))
+    b = Event(kind="tool_end", tool="exec")
+    assert a.kind is b.kind
+    assert a.tool is b.tool
+
+
 def test_eval_result_tool_names():
     event = Event(kind="tool_end", tool="exec")
     case = EvalCase(id="c1", message="hi")
@@ -109,3 +116,48 @@ def test_eval_result_tool_names():
         duration_s=0.1,
     )
     assert result.tool_names == ["exec"]
+
+
+def test_eval_result_output_previews():
+    result = _make_result(EvalCase(id="c1", message="hi"), True)
+    result.final_output = "a" * 250
+    assert result.output_preview == "a" * 200 + "..."
+    assert result.output_preview_short == "a" * 80 + "..."
+
+    short = _make_result(EvalCase(id="c2", message="hi"), True)
+    short.final_output = "done"
+    assert short.output_preview == "done"
+    assert short.output_preview_short == "done"
+
+
+def test_eval_result_tool_names_in_json_report():
+    from dataclasses import asdict
+
+    result = EvalResult(
+        case=EvalCase(id="c1", message="hi"),
+        passed=True,
+        events=[Event(kind="llm_turn"), Event(kind="tool_end", tool="read")],
+        final_output="ok",
+        duration_s=0.1,
+    )
+    # edd diff / judge read tool_names back from the JSON report
+    assert asdict(result)["tool_names"] == ["read"]
+
+
+def test_eval_result_to_dict_matches_asdict():
+    from dataclasses import asdict
+
+    result = EvalResult(
+        case=EvalCase(id="c1", message="hi", expect_tools=["exec"]),
+        passed=False,
+        events=[
+            Event(kind="llm_turn", tool_calls=[{"id": "t1"}], usage={"input": 3}),
+            Event(kind="tool_end", tool="exec", input={"command": "ls"}),
+        ],
+        final_output="ok",
+        duration_s=0.1,
+        failures=["x"],
+        checks={"tool_called": {"passed": True}},
+    )
+    result.output_preview  # cached previews must not leak into the dict
+    assert result.to_dict() == asdict(result)
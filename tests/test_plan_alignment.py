@@ -1,127 +1,78 @@
 """Tests for plan alignment feature."""
 
+import pytest
+
 from openclaw_edd.session_reader import extract_tool_call_info
 
 
-def test_mixed_content_preserves_plan_text():
-    """Text before toolCall must be captured as plan_text."""
-    message = {
-        "type": "message",
-        "message": {
-            "role": "assistant",
-            "content": [
-                {"type": "text", "text": "I'll check slow queries now."},
-                {
-                    "type": "toolCall",
-                    "id": "tc_001",
-                    "name": "exec",
-                    "arguments": {"command": "show processlist"},
-                },
-            ],
-        },
-        "timestamp": "2026-01-01T00:00:00Z",
-        "id": "msg_001",
-    }
-    result = extract_tool_call_info(message)
-    assert result is not None
-    assert result["event"] == "tool_call"
-    assert result["tool"] == "exec"
-    assert result["plan_text"] == "I'll check slow queries now."
+def _tool_call(call_id, name, **arguments):
+    return {"type": "toolCall", "id": call_id, "name": name, "arguments": arguments}
 
 
-def test_toolcall_only_has_empty_plan_text():
-    message = {
-        "type": "message",
-        "message": {
-            "role": "assistant",
-            "content": [
-                {
-                    "type": "toolCall",
-                    "id": "tc_002",
-                    "name": "read",
-                    "arguments": {"path": "/tmp/foo"},
-                },
-            ],
-        },
-        "timestamp": "2026-01-01T00:00:00Z",
-        "id": "msg_002",
-    }
-    result = extract_tool_call_info(message)
-    assert result is not None
-    assert result["event"] == "tool_call"
-    assert result["plan_text"] == ""
+def _text(text):
+    return {"type": "text", "text": text}
 
 
-def test_text_only_returns_llm_response():
-    message = {
-        "type": "message",
-        "message": {
-            "role": "assistant",
-            "content": [
-                {"type": "text", "text": "Here is the answer."},
-            ],
+# (content, expected subset of the extracted event)
+PLAN_CASES = [
+    pytest.param(
+        [
+            _text("I'll check slow queries now."),
+            _tool_call("tc_001", "exec", command="show processlist"),
+        ],
+        {
+            "event": "tool_call",
+            "tool": "exec",
+            "plan_text": "I'll check slow queries now.",
         },
-        "timestamp": "2026-01-01T00:00:00Z",
-        "id": "msg_003",
-    }
-    result = extract_tool_call_info(message)
-    assert result is not None
-    assert result["event"] == "llm_response"
-    assert result["text"] == "Here is the answer."
-
-
-def test_multiple_text_items_concatenated():
-    """Multiple text items should be joined with newlines."""
-    message = {
-        "type": "message",
-        "message": {
-            "role": "assistant",
-            "content": [
-                {"type": "text", "text": "First line of thought."},
-                {"type": "text", "text": "Second line of thought."},
-                {
-                    "type": "toolCall",
-                    "id": "tc_003",
-                    "name": "exec",
-                    "arguments": {"command": "ls"},
-                },
-            ],
+        id="text-before-toolcall-is-plan",
+    ),
+    pytest.param(
+        [_tool_call("tc_002", "read", path="/tmp/foo")],
+        {"event": "tool_call", "plan_text": ""},
+        id="toolcall-only-has-empty-plan",
+    ),
+    pytest.param(
+        [_text("Here is the answer.")],
+        {"event": "llm_response", "text": "Here is the answer."},
+        id="text-only-is-llm-response",
+    ),
+    pytest.param(
+        [
+            _text("First line of thought."),
+            _text("Second line of thought."),
+            _tool_call("tc_003", "exec", command="ls"),
+        ],
+        {
+            "event": "tool_call",
+            "plan_text": "First line of thought.\nSecond line of thought.",
         },
-        "timestamp": "2026-01-01T00:00:00Z",
-        "id": "msg_004",
-    }
-    result = extract_tool_call_info(message)
-    assert result is not None
-    assert result["event"] == "tool_call"
-    assert result["plan_text"] == "First line of thought.\nSecond line of thought."
-
-
-def test_text_after_toolcall_ignored_for_plan():
-    """Text that comes after toolCall is still captured in plan_text."""
+        id="multiple-text-items-joined",
+    ),
+    pytest.param(
+        [
+            _text("Before tool call."),
+            _tool_call("tc_004", "exec", command="ls"),
+            _text("After tool call."),
+        ],
+        {"event": "tool_call", "plan_text": "Before tool call.\nAfter tool call."},
+        id="text-after-toolcall-also-in-plan",
+    ),
+]
+
+
+@pytest.mark.parametrize("content, expected", PLAN_CASES)
+def test_plan_text_extraction(content, expected):
+    """Text around a toolCall becomes plan_text; text alone is an llm_response."""
     message = {
         "type": "message",
-        "message": {
-            "role": "assistant",
-            "content": [
-                {"type": "text", "text": "Before tool call."},
-                {
-                    "type": "toolCall",
-                    "id": "tc_004",
-                    "name": "exec",
-                    "arguments": {"command": "ls"},
-                },
-                {"type": "text", "text": "After tool call."},
-            ],
-        },
+        "message": {"role": "assistant", "content": content},
         "timestamp": "2026-01-01T00:00:00Z",
-        "id": "msg_005",
+        "id": "msg_001",
     }
     result = extract_tool_call_info(message)
     assert result is not None
-    assert result["event"] == "tool_call"
-    # All text items are captured
-    assert "Before tool call." in result["plan_text"]
-    assert "After tool call." in result["plan_text"]
+    assert expected.items() <= result.items()
 
 
 def test_thinking_content_preserved():
@@ -5,18 +5,13 @@ from datetime import datetime
 from openclaw_edd.eval import _check_retries
 from openclaw_edd.models import Event
 
+# Fields shared by every event built with _ev
+_EV_DEFAULTS = {"kind": "tool_end", "output": "", "duration_ms": 100, "session_id": "s"}
+
 
 def _ev(tool: str, command: str, ts: str) -> Event:
     """Create a tool_end event."""
-    return Event(
-        kind="tool_end",
-        tool=tool,
-        input={"command": command},
-        output="",
-        duration_ms=100,
-        ts=ts,
-        session_id="s",
-    )
+    return Event(**_EV_DEFAULTS, tool=tool, input={"command": command}, ts=ts)
 
 
 def test_no_retries():
@@ -1,136 +1,193 @@
 """Tests for session metadata extraction."""
 
 import json
-import tempfile
-from pathlib import Path
 
-from openclaw_edd import session_reader
+import pytest
 
+from openclaw_edd import session_reader
 
-def test_extract_session_metadata():
+# Session file bodies, serialized once at import
+_HEADER_THEN_MESSAGES = [
+    json.dumps(record)
+    for record in (
+        {"type": "session", "version": "1.0", "cwd": "/home/user/project"},
+        {"type": "model_change", "provider": "deepseek", "modelId": "deepseek-chat"},
+        {"type": "thinking_level_change", "thinkingLevel": "high"},
+        {
+            "type": "message",
+            "message": {"role": "user", "content": [{"type": "text", "text": "Hello"}]},
+        },
+        {
+            "type": "message",
+            "message": {
+                "role": "assistant",
+                "content": [{"type": "text", "text": "Hi!"}],
+            },
+        },
+    )
+]
+
+# model_change AFTER a message (should be ignored)
+_MODEL_CHANGE_AFTER_MESSAGE = [
+    {"type": "session", "version": "1.0"},
+    {"type": "message", "message": {"role": "user", "content": []}},
+    {"type": "model_change", "provider": "anthropic", "modelId": "claude-3"},
+]
+
+
+@pytest.fixture
+def session_dir(tmp_path, monkeypatch):
+    """Empty sessions directory installed as session_reader.SESSION_DIR."""
+    monkeypatch.setattr(session_reader, "SESSION_DIR", tmp_path)
+    return tmp_path
+
+
+def test_extract_session_metadata(session_dir):
     """Test extracting metadata from session header events."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create a mock session file
-        session_id = "test-session-123"
-        session_dir = Path(tmpdir) / ".openclaw" / "agents" / "main" / "sessions"
-        session_dir.mkdir(parents=True, exist_ok=True)
-        session_file = session_dir / f"{session_id}.jsonl"
-
-        # Write test data
-        lines = [
-            json.dumps(
-                {"type": "session", "version": "1.0", "cwd": "/home/user/project"}
-            ),
-            json.dumps(
-                {
-                    "type": "model_change",
-                    "provider": "deepseek",
-                    "modelId": "deepseek-chat",
-                }
-            ),
-            json.dumps({"type": "thinking_level_change", "thinkingLevel": "high"}),
-            json.dumps(
-                {
-                    "type": "message",
-                    "message": {
-                        "role": "user",
-                        "content": [{"type": "text", "text": "Hello"}],
-                    },
-                }
-            ),
-            json.dumps(
-                {
-                    "type": "message",
-                    "message": {
-                        "role": "assistant",
-                        "content": [{"type": "text", "text": "Hi!"}],
-                    },
-                }
-            ),
-        ]
-        session_file.write_text("\n".join(lines))
-
-        # Patch SESSION_DIR temporarily
-        original_dir = session_reader.SESSION_DIR
-        session_reader.SESSION_DIR = session_dir
-
-        try:
-            metadata = session_reader.extract_session_metadata(session_id)
-
-            assert metadata["cwd"] == "/home/user/project"
-            assert metadata["session_version"] == "1.0"
-            assert metadata["provider"] == "deepseek"
-            assert metadata["model"] == "deepseek-chat"
-            assert metadata["thinking_level"] == "high"
-        finally:
-            session_reader.SESSION_DIR = original_dir
+    session_id = "test-session-123"
+    (session_dir / f"{session_id}.jsonl").write_text("\n".join(_HEADER_THEN_MESSAGES))
 
+    metadata = session_reader.extract_session_metadata(session_id)
 
-def test_extract_session_metadata_stops_at_message():
-    """Test that metadata extraction stops at first message event."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        session_id = "test-session-456"
-        session_dir = Path(tmpdir) / ".openclaw" / "agents" / "main" / "sessions"
-        session_dir.mkdir(parents=True, exist_ok=True)
-        session_file = session_dir / f"{session_id}.jsonl"
-
-        # Write test data with model_change AFTER a message (should be ignored)
-        lines = [
-            json.dumps({"type": "session", "version": "1.0"}),
-            json.dumps({"type": "message", "message": {"role": "user", "content": []}}),
-            json.dumps(
-                {"type": "model_change", "provider": "anthropic", "modelId": "claude-3"}
-            ),
-        ]
-        session_file.write_text("\n".join(lines))
-
-        original_dir = session_reader.SESSION_DIR
-        session_reader.SESSION_DIR = session_dir
-
-        try:
-            metadata = session_reader.extract_session_metadata(session_id)
-
-            # Should have session but not the model_change (it came after message)
-            assert metadata["session_version"] == "1.0"
-            assert "provider" not in metadata or metadata["provider"] == ""
-            assert "model" not in metadata or metadata["model"] == ""
-        finally:
-            session_reader.SESSION_DIR = original_dir
-
-
-def test_extract_session_metadata_empty_file():
-    """Test extracting metadata from empty session file."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        session_id = "test-session-empty"
-        session_dir = Path(tmpdir) / ".openclaw" / "agents" / "main" / "sessions"
-        session_dir.mkdir(parents=True, exist_ok=True)
-        session_file = session_dir / f"{session_id}.jsonl"
-        session_file.write_text("")
+    assert metadata["cwd"] == "/home/user/project"
+    assert metadata["session_version"] == "1.0"
+    assert metadata["provider"] == "deepseek"
+    assert metadata["model"] == "deepseek-chat"
+    assert metadata["thinking_level"] == "high"
 
-        original_dir = session_reader.SESSION_DIR
-        session_reader.SESSION_DIR = session_dir
 
-        try:
-            metadata = session_reader.extract_session_metadata(session_id)
+def test_extract_session_metadata_stops_at_message():
+    """Test that metadata extraction stops at first message event."""
+    metadata = session_reader._metadata_from_records(_MODEL_CHANGE_AFTER_MESSAGE)
 
-            assert metadata == {}
-        finally:
-            session_reader.SESSION_DIR = original_dir
+    # Should have session but not the model_change (it came after message)
+    assert metadata == {"cwd": "", "session_version": "1.0"}
 
 
-def test_extract_session_metadata_missing_file():
-    """Test extracting metadata when session file doesn't exist."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        session_id = "non-existent-session"
-        session_dir = Path(tmpdir) / ".openclaw" / "agents" / "main" / "sessions"
-        session_dir.mkdir(parents=True, exist_ok=True)
+def test_extract_session_metadata_empty_file(session_dir):
+    """Test extracting metadata from empty session file."""
+    session_id = "test-session-empty"
+    (session_dir / f"{session_id}.jsonl").write_text("")
 
-        original_dir = session_reader.SESSION_DIR
-        session_reader.SESSION_DIR = session_dir
+    assert session_reader.extract_session_metadata(session_id) == {}
 
-        try:
-            metadata = session_reader.extract_session_metadata(session_id)
 
-            assert metadata == {}
-        finally:
-            session_reader.SESSION_DIR = original_dir
+def test_extract_session_metadata_missing_file(session_dir):
+    """Test extracting metadata when session file doesn't exist."""
+    assert session_reader.extract_session_metadata("non-existent-session") == {}
+
+
+def test_build_events_from_session_memoized_until_file_changes(session_dir):
+    """Unchanged session files are parsed once; appends invalidate."""
+    session_id = "memo-session"
+    session_file = session_dir / f"{session_id}.jsonl"
+
+    def assistant(text):
+        return json.dumps(
+            {
+                "type": "message",
+                "message": {
+                    "role": "assistant",
+                    "content": [{"type": "text", "text": text}],
+                    "stopReason": "stop",
+                },
+            }
+        )
+
+    session_file.write_text(assistant("one") + "\n")
+
+    first = session_reader.build_events_from_session(session_id)
+    misses = session_reader._read_session_cached.cache_info().misses
+    second = session_reader.build_events_from_session(session_id)
+    assert [e.text for e in second] == ["one"]
+    assert second is not first
+    assert session_reader._read_session_cached.cache_info().misses == misses
+
+    with open(session_file, "a") as f:
+        f.write(assistant("two") + "\n")
+    events = session_reader.build_events_from_session(session_id)
+    assert [e.text for e in events] == ["one", "two"]
+
+
+def test_metadata_and_events_share_one_read(session_dir):
+    """extract_session_metadata reuses the pass that built the events."""
+    session_id = "fused-session"
+    lines = [
+        {"type": "model_change", "provider": "p", "modelId": "m"},
+        {
+            "type": "message",
+            "message": {
+                "role": "assistant",
+                "content": [{"type": "text", "text": "hi"}],
+            },
+        },
+    ]
+    (session_dir / f"{session_id}.jsonl").write_text(
+        "".join(json.dumps(line) + "\n" for line in lines)
+    )
+
+    misses = session_reader._read_session_cached.cache_info().misses
+    events = session_reader.build_events_from_session(session_id)
+    metadata = session_reader.extract_session_metadata(session_id)
+    assert session_reader._read_session_cached.cache_info().misses == misses + 1
+    assert [e.kind for e in events] == ["llm_turn"]
+    assert metadata == {"provider": "p", "model": "m"}
+
+
+def test_tail_session_file_backs_off_while_idle(session_dir, monkeypatch):
+    """Idle polls grow toward TAIL_POLL_MAX_S and reset on new data."""
+    import time
+
+    session_file = session_dir / "tail-session.jsonl"
+    session_file.write_text(json.dumps({"n": 1}) + "\n")
+
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        if len(sleeps) == 12:
+            with open(session_file, "a") as f:
+                f.write(json.dumps({"n": 2}) + "\n")
+
+    monkeypatch.setattr(time, "sleep", fake_sleep)
+
+    tail = session_reader.tail_session_file("tail-session", from_end=False)
+    assert next(tail) == {"n": 1}
+    assert next(tail) == {"n": 2}
+    assert sleeps[0] == session_reader.TAIL_POLL_MIN_S
+    assert sleeps == sorted(sleeps)
+    assert sleeps[-1] == session_reader.TAIL_POLL_MAX_S
+
+
+def test_read_session_skips_unused_record_types_unparsed(session_dir, monkeypatch):
+    """Only header and message records reach the JSON decoder."""
+    lines = [
+        {"type": "session", "version": 3, "cwd": "/w"},
+        {"type": "custom", "data": {"blob": "x" * 100}},
+        {
+            "type": "message",
+            "message": {
+                "role": "assistant",
+                "content": [{"type": "text", "text": "done"}],
+            },
+        },
+    ]
+    (session_dir / "filtered.jsonl").write_text(
+        "".join(json.dumps(line, separators=(",", ":")) + "\n" for line in lines)
+    )
+
+    decoded = []
+
+    def counting_loader():
+        def loads(line):
+            decoded.append(line)
+            return json.loads(line)
+
+        return loads
+
+    monkeypatch.setattr(session_reader, "json_loader", counting_loader)
+
+    metadata, events = session_reader.read_session("filtered")
+    assert metadata == {"cwd": "/w", "session_version": 3}
+    assert [e.text for e in events] == ["done"]
+    assert len(decoded) == 2
@@ -0,0 +1,120 @@
+"""Tests for state and artifact persistence."""
+
+import json
+
+import pytest
+
+from openclaw_edd import store
+
+
+@pytest.fixture
+def state_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(store, "STATE_DIR", tmp_path)
+    return tmp_path
+
+
+def test_state_set_appends_deltas_without_rewriting_snapshot(state_dir):
+    """state_set writes to the sidecar; state_load replays it."""
+    store.state_save("s1", {"a": 1})
+    snapshot = (state_dir / "s1.json").read_text(encoding="utf-8")
+
+    store.state_set("s1", "b.c", '{"x": 2}')
+    store.state_set("s1", "name", "plain text")
+
+    assert (state_dir / "s1.json").read_text(encoding="utf-8") == snapshot
+    assert len((state_dir / "s1.jsonl").read_text().splitlines()) == 2
+    assert store.state_load("s1") == {
+        "a": 1,
+        "b": {"c": {"x": 2}},
+        "name": "plain text",
+    }
+
+
+def test_state_save_compacts_sidecar(state_dir, monkeypatch):
+    """A full save supersedes the sidecar; large sidecars are compacted."""
+    store.state_set("s2", "a", "1")
+    store.state_save("s2", store.state_load("s2"))
+    assert not (state_dir / "s2.jsonl").exists()
+    assert json.loads((state_dir / "s2.json").read_text()) == {"a": 1}
+
+    monkeypatch.setattr(store, "COMPACT_RATIO", 1)
+    monkeypatch.setattr(store, "COMPACT_MIN_BYTES", 0)
+    store.state_set("s2", "b", "2")
+    assert not (state_dir / "s2.jsonl").exists()
+    assert store.state_load("s2") == {"a": 1, "b": 2}
+
+
+def test_state_load_skips_torn_delta(state_dir):
+    (state_dir / "s3.jsonl").write_text('{"k": "a", "v": 1}\n{"k": "b", "v"')
+    assert store.state_load("s3") == {"a": 1}
+
+
+def test_state_save_replaces_snapshot_atomically(state_dir):
+    store.state_save("s4", {"a": 1})
+    store.state_save("s4", {"name": "café"})
+    assert not (state_dir / "s4.tmp").exists()
+    assert json.loads((state_dir / "s4.json").read_text(encoding="utf-8")) == {
+        "name": "café"
+    }
+
+
+def test_state_save_crash_before_replace_does_not_replay_old_deltas(
+    state_dir, monkeypatch
+):
+    """Deltas a save supersedes are gone before the snapshot swap."""
+    store.state_save("s5", {"keep": 1})
+    store.state_set("s5", "deleted", "2")
+
+    def crash(src, dst):
+        raise OSError("crashed before rename")
+
+    monkeypatch.setattr(store.os, "replace", crash)
+    with pytest.raises(OSError):
+        store.state_save("s5", {"keep": 1})
+    assert store.state_load("s5") == {"keep": 1}
+
+
+def test_artifacts_save_versions_without_rescanning(tmp_path, monkeypatch):
+    monkeypatch.setattr(store, "ARTIFACTS_DIR", tmp_path)
+    (tmp_path / "s1").mkdir()
+    (tmp_path / "s1" / "exec_v0.txt").write_text("old")
+
+    globs = []
+    real_glob = type(tmp_path).glob
+
+    def counting_glob(self, pattern):
+        globs.append(pattern)
+        return real_glob(self, pattern)
+
+    monkeypatch.setattr(type(tmp_path), "glob", counting_glob)
+
+    paths = [store.artifacts_save("s1", "exec", str(i)) for i in range(3)]
+    assert [p.name for p in paths] == ["exec_v1.txt", "exec_v2.txt", "exec_v3.txt"]
+    assert store.artifacts_save("s1", "exec", "x", version=2).name == "exec_v2.txt"
+    assert store.artifacts_save("s1", "exec", "y").name == "exec_v4.txt"
+    assert globs == ["exec_v*.txt"]
+
+
+def test_artifacts_save_never_overwrites_another_writers_version(tmp_path, monkeypatch):
+    monkeypatch.setattr(store, "ARTIFACTS_DIR", tmp_path)
+    first = store.artifacts_save("s2", "exec", "mine")
+    assert first.name == "exec_v0.txt"
+
+    # Another process saves v1 behind this process's cached count
+    (tmp_path / "s2" / "exec_v1.txt").write_text("theirs")
+
+    second = store.artifacts_save("s2", "exec", "mine again")
+    assert second.name == "exec_v2.txt"
+    assert (tmp_path / "s2" / "exec_v1.txt").read_text() == "theirs"
+
+
+def test_state_load_skips_deltas_it_cannot_apply(state_dir):
+    store.state_set("s5", "a", "1")
+    store.state_set("s5", "a.b", "2")
+    store.state_set("s5", "a.b.c", "3")
+    store.state_set("s5", "c.d", "4")
+    assert store.state_load("s5") == {"a": 1, "c": {"d": 4}}
+
+    (state_dir / "s6.json").write_text("[1, 2]")
+    store.state_set("s6", "x.y", "1")
+    assert store.state_load("s6") == {"x": {"y": 1}}
@@ -1,48 +1,44 @@
 """Tests for trace functionality."""
 
 import json
-import tempfile
-import time
+import os
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from openclaw_edd import session_reader
+from openclaw_edd.eval import _check_retries
 from openclaw_edd.models import Event
 
 
-def test_resolve_latest_session():
-    """Test finding the most recent session file."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        session_dir = Path(tmpdir) / ".openclaw" / "agents" / "main" / "sessions"
-        session_dir.mkdir(parents=True, exist_ok=True)
+@pytest.fixture
+def home_sessions_dir(tmp_path, monkeypatch):
+    """Empty ~/.openclaw/agents/main/sessions under a temporary home."""
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    session_dir = tmp_path / ".openclaw" / "agents" / "main" / "sessions"
+    session_dir.mkdir(parents=True)
+    return session_dir
+
 
-        # Create session files with different timestamps
-        session1 = session_dir / "session-001.jsonl"
-        session2 = session_dir / "session-002.jsonl"
-        session3 = session_dir / "session-003.jsonl"
+def test_resolve_latest_session(home_sessions_dir):
+    """Test finding the most recent session file."""
+    # Create session files with different timestamps
+    session1 = home_sessions_dir / "session-001.jsonl"
+    session2 = home_sessions_dir / "session-002.jsonl"
+    session3 = home_sessions_dir / "session-003.jsonl"
 
-        session1.write_text('{"type": "session"}\n')
-        time.sleep(0.01)
-        session2.write_text('{"type": "session"}\n')
-        time.sleep(0.01)
-        session3.write_text('{"type": "session"}\n')
+    # Explicit, strictly increasing mtimes instead of sleeping between writes
+    for n, session in enumerate([session1, session2, session3], start=1):
+        session.write_text('{"type": "session"}\n')
+        os.utime(session, (1000 + n, 1000 + n))
 
-        # Patch Path.home to return our temp directory
-        with patch.object(Path, "home", return_value=Path(tmpdir)):
-            latest = session_reader.resolve_latest_session("main")
-            assert latest == "session-003"
+    assert session_reader.resolve_latest_session("main") == "session-003"
 
 
-def test_resolve_latest_session_empty_dir():
+def test_resolve_latest_session_empty_dir(home_sessions_dir):
     """Test finding latest session when no sessions exist."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        session_dir = Path(tmpdir) / ".openclaw" / "agents" / "main" / "sessions"
-        session_dir.mkdir(parents=True, exist_ok=True)
-
-        # Patch Path.home to return our temp directory
-        with patch.object(Path, "home", return_value=Path(tmpdir)):
-            latest = session_reader.resolve_latest_session("main")
-            assert latest is None
+    assert session_reader.resolve_latest_session("main") is None
 
 
 def test_retry_detection():
@@ -78,29 +74,12 @@ def test_retry_detection():
         ),
     ]
 
-    # Simulate retry counting logic
-    retry_count = 0
-    last_tool = ""
-    last_input = {}
-    retry_indicators = []
-
-    for event in events:
-        is_retry = (
-            event.tool == last_tool
-            and event.input == last_input
-            and event.tool == "exec"
-        )
-        if is_retry:
-            retry_count += 1
-        else:
-            retry_count = 0
-        last_tool = event.tool
-        last_input = event.input
-
-        if retry_count > 0:
-            retry_indicators.append(retry_count)
-
-    assert retry_indicators == [1, 2]
+    result = _check_retries(events, max_retries=2)
+    assert result["max_consecutive"] == 3
+    assert result["retries"] == [
+        {"tool": "exec", "command": "curl https://example.com", "count": 3}
+    ]
+    assert not result["passed"]
 
 
 def test_event_with_plan_text():
@@ -120,3 +99,314 @@ def test_event_with_plan_text():
     assert event.plan_text == "I'll list the files in the directory"
     assert event.model == "deepseek-chat"
     assert event.usage["input"] == 100
+
+
+def test_read_logs_for_session_cached_until_logs_change(tmp_path):
+    """Unchanged logs are served from cache; appends invalidate it."""
+    from openclaw_edd import tracer
+
+    log_dir = tmp_path
+    log_file = log_dir / "openclaw-2026-01-01.log"
+    log_file.write_text(json.dumps({"msg": "tool_start", "session_id": "s1"}) + "\n")
+
+    first = tracer.read_logs_for_session(log_dir, "s1")
+    misses = tracer._read_session_entries.cache_info().misses
+    assert tracer.read_logs_for_session(log_dir, "s1") == first
+    assert tracer._read_session_entries.cache_info().misses == misses
+
+    older = log_dir / "openclaw-2025-12-31.log"
+    older.write_text(json.dumps({"msg": "tool_end", "session_id": "s1"}) + "\n")
+    assert len(tracer.read_logs_for_session(log_dir, "s1")) == 2
+
+    # Growing one file rescans only that file
+    misses = tracer._read_session_entries.cache_info().misses
+    with open(log_file, "a") as f:
+        f.write(json.dumps({"msg": "tool_end", "session_id": "s1"}) + "\n")
+    assert len(tracer.read_logs_for_session(log_dir, "s1")) == 3
+    assert tracer._read_session_entries.cache_info().misses == misses + 1
+
+
+def test_iter_file_lines_handles_empty_and_unterminated_files(tmp_path, monkeypatch):
+    """The chunked line scanner matches text-mode iteration."""
+    from openclaw_edd import tracer
+
+    empty = tmp_path / "empty.log"
+    empty.write_bytes(b"")
+    assert list(tracer._iter_file_lines(empty)) == []
+
+    log = tmp_path / "openclaw.log"
+    log.write_bytes(b'{"a": 1}\r\n\n{"b": "\xe4\xb8\x8a"}')
+    assert list(tracer._iter_file_lines(log)) == [
+        b'{"a": 1}\r',
+        b"",
+        b'{"b": "\xe4\xb8\x8a"}',
+    ]
+
+    # Lines straddling chunk boundaries are stitched back together
+    monkeypatch.setattr(tracer, "READ_BUFFER_BYTES", 3)
+    assert list(tracer._iter_file_lines(log)) == [
+        b'{"a": 1}\r',
+        b"",
+        b'{"b": "\xe4\xb8\x8a"}',
+    ]
+
+
+def test_read_logs_for_session_skips_other_sessions_before_parsing(tmp_path):
+    """Lines for other sessions are rejected from the raw bytes."""
+    from openclaw_edd import tracer
+
+    log_dir = tmp_path
+    lines = [
+        {"msg": "tool_start", "session_id": "other-1", "tool": "exec"},
+        {"msg": "tool_start", "session_id": "abc-123", "tool": "read"},
+        {"_meta": {"date": "t"}, "1": "embedded run tool end sessionId=abc-123"},
+    ]
+    (log_dir / "openclaw-2026-01-02.log").write_text(
+        "".join(json.dumps(line) + "\n" for line in lines)
+    )
+
+    parsed = []
+    real_parse_line = tracer.parse_line
+
+    def counting_parse_line(line):
+        parsed.append(line)
+        return real_parse_line(line)
+
+    with patch.object(tracer, "parse_line", counting_parse_line):
+        entries = tracer.read_logs_for_session(log_dir, "abc")
+
+    assert [e.get("tool") for e in entries] == ["read", None]
+    assert len(parsed) == 2
+
+
+def test_sessions_from_logs_skips_lines_without_session_markers(tmp_path):
+    """Lines that cannot carry a session id never reach json.loads."""
+    from openclaw_edd import tracer
+
+    log_dir = tmp_path
+    lines = [
+        {"msg": "gateway ready", "port": 8080},
+        {"msg": "tool_end", "session_id": "s-1", "ts": "2", "tool": "exec"},
+        {"_meta": {"date": "1"}, "1": "embedded run start runId=abc-1"},
+    ]
+    (log_dir / "openclaw-2026-01-02.log").write_text(
+        "".join(json.dumps(line) + "\n" for line in lines) + "\x1b[0mnot json\n"
+    )
+
+    parsed = []
+    real_parse_line = tracer.parse_line
+
+    def counting_parse_line(line):
+        parsed.append(line)
+        return real_parse_line(line)
+
+    with patch.object(tracer, "parse_line", counting_parse_line):
+        sessions = tracer.sessions_from_logs(log_dir)
+
+    # The flat tool_end line is read without parse_line as well
+    assert len(parsed) == 1
+    assert {s["session_id"]: s["tool_count"] for s in sessions} == {
+        "s-1": 1,
+        "abc-1": 0,
+    }
+
+
+def test_sessions_from_logs_flat_fast_path_matches_parse_line(tmp_path):
+    """Flat lines read by regex aggregate exactly like parsed ones."""
+    from openclaw_edd import tracer
+
+    lines = [
+        '{"msg": "tool_end", "session_id": "s-1", "ts": "2", "agent": "main"}',
+        '{"msg": "response sent", "session_id": "s-1", "ts": "3"}',
+        '{"msg": "tool_end", "session_id": "s-1", "ts": "1", "data": {"a": 1}}',
+        '{"msg": "say \\"hi\\"", "session_id": "s-2", "ts": "5"}',
+        '{"event": "agent.run.tool_end", "session_id": "s-2", "ts": "4"}',
+        '{"_meta": {"date": "6"}, "1": "embedded run done sessionId=abc-1"}',
+        '{"msg": "tool_end", "session_id": "s-1", "ts": "9"',
+    ]
+    assert tracer._flat_fields(lines[0].encode()) == {
+        "msg": "tool_end",
+        "session_id": "s-1",
+        "ts": "2",
+        "agent": "main",
+    }
+    for line in lines[2:4] + lines[5:]:
+        assert tracer._flat_fields(line.encode()) is None
+
+    log_dir = tmp_path
+    (log_dir / "openclaw-2026-01-02.log").write_text("\n".join(lines) + "\n")
+    with patch.object(tracer, "_flat_fields", return_value=None):
+        expected = tracer.sessions_from_logs(log_dir)
+    tracer._file_session_stats.cache_clear()
+    assert tracer.sessions_from_logs(log_dir) == expected
+    assert [s["session_id"] for s in expected] == ["abc-1", "s-2", "s-1"]
+
+
+def test_read_logs_for_session_needle_rejects_lines_without_id(tmp_path):
+    """Lines that never mention the id are skipped before any regex."""
+    from openclaw_edd import tracer
+
+    log_dir = tmp_path
+    lines = [
+        {"_meta": {"date": "t"}, "1": "embedded run start runId=ffff-1"},
+        {"_meta": {"date": "t"}, "1": "embedded run done sessionId=abc-9"},
+    ]
+    (log_dir / "openclaw-2026-01-03.log").write_text(
+        "".join(json.dumps(line) + "\n" for line in lines)
+    )
+    with patch.object(tracer, "parse_line", wraps=tracer.parse_line) as parse:
+        entries = tracer.read_logs_for_session(log_dir, "abc")
+    assert [e["session_id"] for e in entries] == ["abc-9"]
+    assert parse.call_count == 1
+
+
+def test_sessions_from_logs_cached_per_file_and_merged(tmp_path):
+    """Unchanged files are not rescanned; per-file stats merge across files."""
+    from openclaw_edd import tracer
+
+    log_dir = tmp_path
+    (log_dir / "openclaw-2026-01-01.log").write_text(
+        '{"msg": "tool_end", "session_id": "s-1", "ts": "2", "agent": "a"}\n'
+    )
+    today = log_dir / "openclaw-2026-01-02.log"
+    today.write_text('{"msg": "run finished", "session_id": "s-1", "ts": "1"}\n')
+
+    first = tracer.sessions_from_logs(log_dir)
+    assert first == [
+        {
+            "session_id": "s-1",
+            "first_ts": "1",
+            "last_ts": "2",
+            "tool_count": 1,
+            "turns": 1,
+            "agent": "a",
+        }
+    ]
+    first[0]["tool_count"] = 99  # callers may mutate the result
+
+    misses = tracer._file_session_stats.cache_info().misses
+    with today.open("a") as f:
+        f.write('{"msg": "tool_end", "session_id": "s-1", "ts": "3"}\n')
+    again = tracer.sessions_from_logs(log_dir)
+    assert tracer._file_session_stats.cache_info().misses == misses + 1
+    assert again[0]["tool_count"] == 2
+    assert again[0]["last_ts"] == "3"
+
+
+def test_read_all_logs_parallel_matches_sequential(tmp_path, monkeypatch):
+    """Worker-process scanning returns the same entries in file order."""
+    from openclaw_edd import tracer
+
+    log_dir = tmp_path
+    for day in (1, 2, 3):
+        (log_dir / f"openclaw-2026-01-0{day}.log").write_text(
+            "".join(
+                json.dumps({"msg": "tool_end", "session_id": f"s-{day}", "n": n}) + "\n"
+                for n in range(3)
+            )
+        )
+
+    sequential = tracer.read_all_logs(log_dir)
+    monkeypatch.setattr(tracer, "PARALLEL_SCAN_MIN_BYTES", 0)
+    assert tracer.read_all_logs(log_dir) == sequential
+    assert [e["session_id"] for e in sequential[::3]] == ["s-1", "s-2", "s-3"]
+
+
+def test_parse_line_same_result_with_and_without_orjson(monkeypatch):
+    from openclaw_edd import jsoncodec, tracer
+
+    lines = [
+        b'{"msg": "tool_end", "session_id": "s-1", "tool": "exec"}\n',
+        b'{"_meta": {"date": "t"}, "1": "embedded run done sessionId=ab-1"}',
+        b"\x1b[32mnot json\x1b[0m",
+        b'{"msg": "\xff"}',
+    ]
+    results = []
+    for codec in (jsoncodec.orjson_module(), None):
+        monkeypatch.setattr(jsoncodec, "orjson_module", lambda: codec)
+        results.append([tracer.parse_line(line) for line in lines])
+    assert results[0] == results[1]
+    assert results[0][2:] == [None, None]
+
+
+def test_tail_f_rate_limits_rotation_stat(tmp_path, monkeypatch):
+    """Idle polling does not stat the log on every tick."""
+    from openclaw_edd import tracer
+
+    log = tmp_path / "openclaw.log"
+    log.write_text("a\n")
+
+    ticks = []
+
+    def fake_sleep(_s):
+        ticks.append(_s)
+        if len(ticks) == 20:
+            with log.open("a") as f:
+                f.write("b\n")
+
+    stats = []
+    real_stat = tracer.os.stat
+    monkeypatch.setattr(tracer.time, "sleep", fake_sleep)
+    monkeypatch.setattr(
+        tracer.os, "stat", lambda p, *a, **k: stats.append(p) or real_stat(p)
+    )
+
+    lines = tracer.tail_f(log, from_end=False)
+    assert next(lines) == "a\n"
+    stats.clear()
+    assert next(lines) == "b\n"
+    assert len(ticks) == 20
+    assert stats == []
+
+
+def test_parse_line_strips_ansi_only_when_present():
+    from openclaw_edd import tracer
+
+    colored = '\x1b[2m{"msg": "tool_end", "session_id": "s-1"}\x1b[0m\n'
+    expected = {"msg": "tool_end", "session_id": "s-1"}
+    assert tracer.parse_line(colored) == expected
+    assert tracer.parse_line(colored.encode()) == expected
+    with patch.object(tracer, "ANSI_BYTES_RE") as ansi:
+        assert tracer.parse_line(b'{"session_id": "s-1"}') == {"session_id": "s-1"}
+    ansi.sub.assert_not_called()
+
+
+def test_get_workspace_rereads_config_only_when_changed(tmp_path, monkeypatch):
+    from openclaw_edd import tracer
+
+    monkeypatch.setattr(tracer.Path, "home", lambda: tmp_path)
+    assert tracer.get_workspace() == tmp_path / ".openclaw" / "workspace"
+
+    config = tmp_path / ".openclaw" / "openclaw.json"
+    config.parent.mkdir()
+    config.write_text(json.dumps({"agents": {"defaults": {"workspace": "/w1"}}}))
+    assert tracer.get_workspace() == Path("/w1")
+
+    misses = tracer._configured_workspace.cache_info().misses
+    assert tracer.get_workspace() == Path("/w1")
+    assert tracer._configured_workspace.cache_info().misses == misses
+
+    config.write_text(json.dumps({"agents": {"defaults": {"workspace": "/w2"}}}))
+    os.utime(config, ns=(0, config.stat().st_mtime_ns + 1))
+    assert tracer.get_workspace() == Path("/w2")
+    assert tracer.get_workspace("~/override") == Path("~/override").expanduser()
+
+
+def test_large_log_chunk_scans_match_buffered_reads(tmp_path, monkeypatch):
+    from openclaw_edd import tracer
+
+    log_dir = tmp_path
+    (log_dir / "openclaw-2026-01-04.log").write_text(
+        '{"msg": "tool_end", "session_id": "s-1", "ts": "1"}\r\n'
+        "\n"
+        '{"_meta": {"date": "2"}, "1": "response sent sessionId=ab-1"}'
+    )
+    buffered = (tracer.read_all_logs(log_dir), tracer.sessions_from_logs(log_dir))
+
+    monkeypatch.setattr(tracer, "CHUNK_SCAN_MIN_BYTES", 0)
+    tracer._file_session_stats.cache_clear()
+    with patch.object(tracer, "_iter_file_lines", wraps=tracer._iter_file_lines) as it:
+        mapped = (tracer.read_all_logs(log_dir), tracer.sessions_from_logs(log_dir))
+    assert it.call_count == 2
+    assert mapped == buffered
+    assert len(buffered[0]) == 2
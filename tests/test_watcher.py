@@ -0,0 +1,407 @@
+"""Tests for the session file watcher."""
+
+import argparse
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from openclaw_edd import watcher
+
+
+@pytest.fixture
+def sessions_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(watcher.Path, "home", lambda: tmp_path)
+    path = tmp_path / ".openclaw" / "agents" / "main" / "sessions"
+    path.mkdir(parents=True)
+    return path
+
+
+def _args(**overrides):
+    defaults = {"session": None, "from_start": False, "save_artifacts": False}
+    defaults.update(overrides)
+    return argparse.Namespace(**defaults)
+
+
+class _TickingStop(threading.Event):
+    """Stop event whose wait() runs a callback instead of blocking."""
+
+    def __init__(self, on_tick):
+        super().__init__()
+        self.on_tick = on_tick
+        self.delays = []
+
+    def wait(self, timeout=None):
+        self.delays.append(timeout)
+        if self.on_tick(len(self.delays), timeout) is False:
+            self.set()
+        return self.is_set()
+
+
+def _run_ticks(args, on_tick):
+    """Run the watch loop, calling on_tick(tick, delay) for every poll wait."""
+    stop = _TickingStop(on_tick)
+    watcher._watch_session_files(args, stop)
+    return stop.delays
+
+
+def test_watch_backs_off_while_idle_and_resets_on_data(sessions_dir):
+    session_file = sessions_dir / "s-1.jsonl"
+    session_file.write_text("")
+    user = {"id": "m1", "message": {"role": "user", "content": []}}
+
+    def on_tick(tick, _delay):
+        if tick == 3:
+            with session_file.open("a") as f:
+                f.write(json.dumps(user) + "\n")
+        return tick < 5
+
+    delays = _run_ticks(_args(), on_tick)
+    assert delays[0] > watcher.WATCH_POLL_MIN_S
+    assert delays[1] > delays[0]
+    assert delays[3] == watcher.WATCH_POLL_MIN_S
+    assert max(delays) <= watcher.WATCH_POLL_MAX_S
+
+
+def test_watch_renders_invocation_from_raw_lines(sessions_dir, capsys):
+    session_file = sessions_dir / "s-2.jsonl"
+    messages = [
+        {
+            "id": "u1",
+            "timestamp": "2026-03-01T00:00:00Z",
+            "message": {"role": "user", "content": [{"type": "text", "text": "hi"}]},
+        },
+        {
+            "id": "a1",
+            "timestamp": "2026-03-01T00:00:02Z",
+            "message": {
+                "role": "assistant",
+                "content": [{"type": "text", "text": "hello there"}],
+            },
+        },
+    ]
+    session_file.write_text(
+        "\n".join(json.dumps(m) for m in messages) + "\n\nnot json\n"
+    )
+
+    _run_ticks(_args(from_start=True), lambda tick, _d: tick < 2)
+    out = capsys.readouterr().out
+    assert 'invocation  "hi"  2.0s' in out
+    assert "reply: hello there" in out
+    assert out.count("invocation  ") == 1
+
+
+def test_bounded_set_evicts_oldest():
+    seen = watcher._BoundedSet(2)
+    for item in ("a", "b", "c"):
+        seen.add(item)
+    assert "a" not in seen
+    assert "b" in seen and "c" in seen
+    assert len(seen) == 2
+
+
+def test_watch_from_start_resumes_at_position(sessions_dir, monkeypatch, capsys):
+    """--from-start reads each line once, so dedup can stay bounded."""
+    monkeypatch.setattr(watcher, "PROCESSED_IDS_MAX", 1)
+    session_file = sessions_dir / "s-3.jsonl"
+    lines = [
+        {"id": "u1", "message": {"role": "user", "content": []}},
+        {
+            "id": "a1",
+            "message": {
+                "role": "assistant",
+                "content": [{"type": "text", "text": "ok"}],
+            },
+        },
+        {"id": "x1", "message": {"role": "system"}},
+    ]
+    session_file.write_text("".join(json.dumps(line) + "\n" for line in lines))
+
+    _run_ticks(_args(from_start=True), lambda tick, _d: tick < 3)
+    assert capsys.readouterr().out.count("reply: ok") == 1
+
+
+def test_watch_session_filter_applies_before_top_ten(sessions_dir, capsys):
+    """Newer non-matching sessions don't push the filtered one out."""
+    target = sessions_dir / "keep-1.jsonl"
+    user = {"id": "u1", "message": {"role": "user", "content": []}}
+    reply = {
+        "id": "a1",
+        "message": {"role": "assistant", "content": [{"type": "text", "text": "ok"}]},
+    }
+    target.write_text(json.dumps(user) + "\n" + json.dumps(reply) + "\n")
+    for i in range(12):
+        other = sessions_dir / f"other-{i}.jsonl"
+        other.write_text("")
+        os.utime(other, (time.time() + 10 + i, time.time() + 10 + i))
+
+    _run_ticks(_args(session="keep", from_start=True), lambda tick, _d: False)
+    assert "reply: ok" in capsys.readouterr().out
+
+
+def test_user_text_cleanup():
+    text = "System: [cron] ping\n\n[Sun 2026-03-01 02:41 GMT+8] fix it [message_id: 42]"
+    buffers = {}
+    message = {"message": {"role": "user", "content": [{"type": "text", "text": text}]}}
+    watcher._process_message(message, "s-1", _args(), buffers)
+    assert buffers["s-1"]["user_text"] == "fix it"
+
+
+def test_elapsed_ms_handles_zulu_and_offsets():
+    assert (
+        watcher._elapsed_ms("2026-03-01T00:00:00Z", "2026-03-01T00:00:01.250Z") == 1250
+    )
+    assert (
+        watcher._elapsed_ms("2026-03-01T08:00:00+08:00", "2026-03-01T00:00:02Z") == 2000
+    )
+
+
+def test_watch_keeps_partial_line_for_next_tick(sessions_dir, capsys):
+    session_file = sessions_dir / "s-4.jsonl"
+    session_file.write_text("")
+    user = json.dumps({"id": "u1", "message": {"role": "user", "content": []}})
+    reply = json.dumps(
+        {
+            "id": "a1",
+            "message": {
+                "role": "assistant",
+                "content": [{"type": "text", "text": "ok"}],
+            },
+        }
+    )
+
+    def on_tick(tick, _delay):
+        with session_file.open("a") as f:
+            if tick == 1:
+                f.write(user + "\n" + reply[:20])
+            elif tick == 2:
+                f.write(reply[20:] + "\n")
+        return tick < 3
+
+    _run_ticks(_args(), on_tick)
+    assert capsys.readouterr().out.count("reply: ok") == 1
+
+
+def test_cmd_watch_daemon_spawns_detached_child(tmp_path, monkeypatch):
+    calls = []
+
+    class FakePopen:
+        pid = 4321
+
+        def __init__(self, cmd, **kwargs):
+            calls.append((cmd, kwargs))
+
+    monkeypatch.setattr(watcher.subprocess, "Popen", FakePopen)
+    monkeypatch.setattr(watcher.sys, "argv", ["openclaw-edd", "watch", "--daemon"])
+    monkeypatch.delenv(watcher.WATCH_CHILD_ENV, raising=False)
+    args = _args(
+        daemon=True,
+        pid_file=str(tmp_path / "watch.pid"),
+        daemon_log=str(tmp_path / "watch.log"),
+    )
+
+    with pytest.raises(SystemExit) as exc:
+        watcher.cmd_watch(args)
+    assert exc.value.code == 0
+    assert (tmp_path / "watch.pid").read_text() == "4321"
+    ((cmd, kwargs),) = calls
+    assert cmd[1:] == ["-m", "openclaw_edd", "watch", "--daemon"]
+    assert kwargs["env"][watcher.WATCH_CHILD_ENV] == "1"
+
+
+def test_cmd_watch_daemon_child_runs_in_place(sessions_dir, monkeypatch):
+    monkeypatch.setenv(watcher.WATCH_CHILD_ENV, "1")
+    monkeypatch.setattr(watcher.subprocess, "Popen", None)
+    monkeypatch.setattr(watcher.signal, "signal", lambda *a: None)
+    ran = []
+    monkeypatch.setattr(watcher, "_watch_session_files", lambda a, r: ran.append(a))
+    args = _args(daemon=True)
+    watcher.cmd_watch(args)
+    assert ran == [args]
+
+
+def test_find_latest_log_picks_newest_by_mtime(tmp_path):
+    for i, name in enumerate(["openclaw-b.log", "openclaw-a.log", "other.log"]):
+        path = tmp_path / name
+        path.write_text("")
+        os.utime(path, (1000 + i, 1000 + i))
+    assert watcher._find_latest_log(tmp_path) == tmp_path / "openclaw-a.log"
+
+    missing = tmp_path / "missing"
+    assert watcher._find_latest_log(missing).parent == missing
+
+
+def test_bar_table_matches_computed_bars():
+    for duration, max_ms in [
+        (0, 100),
+        (5, 0),
+        (1, 100),
+        (50, 100),
+        (100, 100),
+        (300, 100),
+    ]:
+        filled = (
+            0 if duration <= 0 or max_ms <= 0 else round(min(duration / max_ms, 1) * 16)
+        )
+        assert watcher._bar(duration, max_ms) == "█" * filled + "░" * (16 - filled)
+    assert watcher._bar(50, 100, width=4) == "██░░"
+
+
+def test_truncate_strips_and_shortens():
+    assert watcher._truncate("short", 10) == "short"
+    assert watcher._truncate("  padded\n", 10) == "padded"
+    assert watcher._truncate("", 10) == ""
+    assert watcher._truncate(12345, 10) == "12345"
+    assert watcher._truncate("x" * 12, 10) == "x" * 7 + "..."
+    assert watcher._truncate("  " + "x" * 9 + "  ", 10) == "x" * 9
+
+
+def test_watch_decodes_only_role_lines(sessions_dir, monkeypatch, capsys):
+    session_file = sessions_dir / "s-5.jsonl"
+    lines = [
+        json.dumps({"type": "session", "version": 3}),
+        json.dumps({"type": "model_change", "modelId": "m"}),
+        json.dumps({"id": "u1", "message": {"role": "user", "content": []}}),
+        json.dumps(
+            {
+                "id": "a1",
+                "message": {
+                    "role": "assistant",
+                    "content": [{"type": "text", "text": "ok"}],
+                },
+            },
+            separators=(",", ":"),
+        ),
+    ]
+    session_file.write_text("\n".join(lines) + "\n")
+    decoded = []
+
+    def counting_loader():
+        def loads(line):
+            decoded.append(line)
+            return json.loads(line)
+
+        return loads
+
+    monkeypatch.setattr(watcher, "json_loader", counting_loader)
+    _run_ticks(_args(from_start=True), lambda tick, _d: False)
+    assert len(decoded) == 2
+    assert "reply: ok" in capsys.readouterr().out
+
+
+def test_parallel_tool_calls_match_results_by_id():
+    buffers = {}
+    args = _args()
+    steps = [
+        {"message": {"role": "user", "content": [{"type": "text", "text": "go"}]}},
+        {
+            "message": {
+                "role": "assistant",
+                "content": [
+                    {"type": "toolCall", "id": "c1", "name": "read", "arguments": {}},
+                    {"type": "toolCall", "id": "c2", "name": "exec", "arguments": {}},
+                ],
+            }
+        },
+        {
+            "message": {
+                "role": "toolResult",
+                "toolCallId": "c2",
+                "toolName": "exec",
+                "details": {"durationMs": 5},
+            }
+        },
+        {"message": {"role": "toolResult", "toolName": "read", "details": {}}},
+    ]
+    for step in steps:
+        watcher._process_message(step, "s-1", args, buffers)
+
+    buf = buffers["s-1"]
+    assert [e["tool"] for e in buf["events"]] == ["exec", "read"]
+    assert buf["pending_tool_calls"] == {}
+
+
+def test_newest_first_keeps_every_recently_modified_entry(tmp_path):
+    now = time.time()
+    for i in range(5):
+        path = tmp_path / f"s-{i}.jsonl"
+        path.write_text("")
+        os.utime(path, (now - i * 100, now - i * 100))
+
+    def match(name):
+        return name.endswith(".jsonl")
+
+    assert len(watcher._newest_first(tmp_path, match, limit=2)) == 2
+    recent = watcher._newest_first(tmp_path, match, 2, modified_since=now - 350)
+    assert [p.name for p in recent] == [f"s-{i}.jsonl" for i in range(4)]
+    floor = watcher._newest_first(tmp_path, match, 2, modified_since=now + 10)
+    assert len(floor) == 2
+
+
+def test_watch_reuses_handles_and_reopens_replaced_files(sessions_dir, capsys):
+    session_file = sessions_dir / "s-6.jsonl"
+    session_file.write_text("")
+    opened = []
+    real_open = open
+
+    def counting_open(path, *args, **kwargs):
+        opened.append(path)
+        return real_open(path, *args, **kwargs)
+
+    def reply(text):
+        return json.dumps(
+            {
+                "id": text,
+                "message": {
+                    "role": "assistant",
+                    "content": [{"type": "text", "text": text}],
+                },
+            }
+        )
+
+    user = json.dumps({"id": "u1", "message": {"role": "user", "content": []}})
+
+    def on_tick(tick, _delay):
+        if tick == 2:
+            with session_file.open("a") as f:
+                f.write(user + "\n" + reply("first") + "\n")
+        elif tick == 4:
+            rotated = sessions_dir / "s-6.tmp"
+            rotated.write_text(user.replace("u1", "u2") + "\n" + reply("second") + "\n")
+            os.replace(rotated, session_file)
+        return tick < 6
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(watcher, "_KEEP_HANDLES", True)
+        mp.setattr(watcher, "open", counting_open, raising=False)
+        _run_ticks(_args(), on_tick)
+
+    out = capsys.readouterr().out
+    assert "reply: first" in out and "reply: second" in out
+    assert opened == [session_file, session_file]
+
+
+def test_watch_json_format_writes_one_line_per_invocation(sessions_dir, capsys):
+    session_file = sessions_dir / "s-7.jsonl"
+    lines = [
+        {"id": "u1", "message": {"role": "user", "content": []}},
+        {
+            "id": "a1",
+            "message": {
+                "role": "assistant",
+                "content": [{"type": "text", "text": "héllo"}],
+            },
+        },
+    ]
+    session_file.write_text("".join(json.dumps(line) + "\n" for line in lines))
+
+    _run_ticks(_args(from_start=True, format="json"), lambda tick, _d: False)
+    captured = capsys.readouterr()
+    (line,) = captured.out.splitlines()
+    record = json.loads(line)
+    assert set(record) == {"session_id", "user_text", "start_ts", "total_ms", "events"}
+    assert record["session_id"] == "s-7"
+    assert record["events"][0]["reply_text"] == "héllo"
+    assert "Watching session files" in captured.err